@@ -1,6 +1,6 @@
 from channels.generic.websocket import AsyncJsonWebsocketConsumer
 from services.transcript_service import TranscriptService
-from services.video_service import VideoService
+from services.video_service import get_video_service
 import json
 import asyncio
 from django.http import JsonResponse
@@ -12,7 +12,8 @@ from typing import Optional, Dict, Any, List, Union
 class VideoChatConsumer(AsyncJsonWebsocketConsumer):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.video_service = VideoService()
+        # shared with the HTTP views, nothing is loaded per connection
+        self.video_service = get_video_service()
         self.openai_service = OpenAIService()
         self.room_group_name = None
         self.video_id = None
@@ -44,10 +45,14 @@ class VideoChatConsumer(AsyncJsonWebsocketConsumer):
         if not video_info:
             return JsonResponse({'error': 'Video not found'}, status=404)
 
+        transcript = await self.video_service.get_transcript(self.video_id, with_embeddings=False)
+        if transcript is None:
+            raise ValueError("Video is still processing, try again once it has completed")
+
         try:
             response = await self.openai_service.get_chat_response(
                 question=message,
-                transcript=video_info['transcript']
+                transcript=transcript
             )
             
             return response
@@ -169,6 +174,20 @@ class VideoChatConsumer(AsyncJsonWebsocketConsumer):
             print(f"Disconnect error: {str(e)}")
             print(traceback.format_exc())
             
+    async def transcript_segments(self, event: Dict[str, Any]) -> None:
+        """Forward segments transcribed while the video is still processing
+        
+        Args:
+            event: Group event with the new segments, seconds of audio
+                transcribed and overall progress
+        """
+        await self.send_json({
+            'type': 'transcript.segments',
+            'segments': event['segments'],
+            'transcribed_seconds': event['transcribed_seconds'],
+            'progress': event['progress']
+        })
+            
     async def send_error(self, error_message: str) -> None:
         """Send error message to client
         
@@ -0,0 +1,56 @@
+import asyncio
+from typing import Any
+import numpy as np
+from django.core.management.base import BaseCommand
+from services.cache_service import CacheService
+from services.search_index import SearchIndex
+from services.transcript_service import TranscriptService
+
+
+class Command(BaseCommand):
+    help = 'Add every cached video transcript to the library search index'
+
+    # transcripts fetched per cache round trip
+    BATCH_SIZE = 100
+
+    def handle(self, *args, **options) -> None:
+        indexed = asyncio.run(self._build())
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} videos'))
+
+    async def _build(self) -> int:
+        search_index = SearchIndex()
+        indexed = 0
+
+        video_ids = [key[len('video_'):] for key in await CacheService.keys('video_*')]
+
+        for offset in range(0, len(video_ids), self.BATCH_SIZE):
+            batch = video_ids[offset:offset + self.BATCH_SIZE]
+            transcripts = await CacheService.get_many([f"transcript_{video_id}" for video_id in batch])
+
+            for video_id in batch:
+                if await self._index_video(search_index, video_id, transcripts.get(f"transcript_{video_id}")):
+                    indexed += 1
+
+        return indexed
+
+    async def _index_video(self, search_index: SearchIndex, video_id: str, transcript: Any) -> bool:
+        # transcripts cached before the metadata split live on the video record
+        if not isinstance(transcript, dict):
+            video_info = await CacheService.get(f"video_{video_id}")
+            transcript = video_info.get('transcript') if isinstance(video_info, dict) else None
+        if not transcript:
+            return False
+
+        segments = transcript.get('segments', [])
+
+        # older transcripts keep embeddings inline, oldest ones per segment
+        embeddings = await CacheService.get_array(f"embeddings_{video_id}")
+        if embeddings is None:
+            embeddings = transcript.get('embeddings')
+        if embeddings is None:
+            embeddings = TranscriptService._normalize_rows(
+                np.asarray([segment['embedding'] for segment in segments], dtype=np.float32)
+            )
+
+        search_index.add_video(video_id, embeddings, segments)
+        return True
@@ -0,0 +1,13 @@
+import asyncio
+from django.core.management.base import BaseCommand
+from services.video_file_manager import VideoFileManager
+
+
+class Command(BaseCommand):
+    help = 'Sync the video catalog with files added or removed outside the upload API'
+
+    def handle(self, *args, **options) -> None:
+        result = asyncio.run(VideoFileManager.reconcile_catalog())
+        self.stdout.write(self.style.SUCCESS(
+            f"Added {result['added']} and removed {result['removed']} catalog entries"
+        ))
@@ -0,0 +1,35 @@
+import asyncio
+from django.core.management.base import BaseCommand
+from services.video_service import VideoService
+
+
+class Command(BaseCommand):
+    help = 'Recompute segment embeddings for processed videos with the current model'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            'video_ids',
+            nargs='*',
+            help='IDs of the videos to re-embed (default: every cached video)'
+        )
+
+    def handle(self, *args, **options) -> None:
+        reembedded = asyncio.run(self._reembed(options['video_ids']))
+        self.stdout.write(self.style.SUCCESS(f'Re-embedded {reembedded} videos'))
+
+    async def _reembed(self, video_ids: list[str]) -> int:
+        video_service = VideoService()
+
+        if not video_ids:
+            keys = await video_service.cache_service.keys('video_*')
+            video_ids = [key[len('video_'):] for key in keys]
+
+        reembedded = 0
+        for video_id in video_ids:
+            try:
+                if await video_service.reembed_video(video_id):
+                    reembedded += 1
+            except Exception as e:
+                self.stderr.write(f'Error re-embedding video {video_id}: {str(e)}')
+
+        return reembedded
@@ -0,0 +1,40 @@
+import asyncio
+from django.core.management.base import BaseCommand
+from services.video_service import VideoService
+
+
+class Command(BaseCommand):
+    help = 'Regenerate transcripts for processed videos from their cached audio'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            'video_ids',
+            nargs='*',
+            help='IDs of the videos to re-transcribe (default: every cached video)'
+        )
+        parser.add_argument(
+            '--reextract-audio',
+            action='store_true',
+            help='Decode the audio from each video again instead of using the cached copy'
+        )
+
+    def handle(self, *args, **options) -> None:
+        retranscribed = asyncio.run(self._retranscribe(options['video_ids'], options['reextract_audio']))
+        self.stdout.write(self.style.SUCCESS(f'Re-transcribed {retranscribed} videos'))
+
+    async def _retranscribe(self, video_ids: list[str], reextract_audio: bool) -> int:
+        video_service = VideoService()
+
+        if not video_ids:
+            keys = await video_service.cache_service.keys('video_*')
+            video_ids = [key[len('video_'):] for key in keys]
+
+        retranscribed = 0
+        for video_id in video_ids:
+            try:
+                if await video_service.retranscribe_video(video_id, reextract_audio):
+                    retranscribed += 1
+            except Exception as e:
+                self.stderr.write(f'Error re-transcribing video {video_id}: {str(e)}')
+
+        return retranscribed
@@ -0,0 +1,49 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from services.model_registry import ModelRegistry
+from services.model_server import ModelServer, ModelServerError
+
+
+class Command(BaseCommand):
+    help = 'Serve Whisper and the embedding model to every worker over a Unix socket'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--socket',
+            default=settings.MODEL_SERVER_SOCKET,
+            help='Path of the Unix socket to listen on (default: MODEL_SERVER_SOCKET)'
+        )
+        parser.add_argument(
+            '--lazy',
+            action='store_true',
+            help='Load each model on its first request instead of at startup'
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not options['socket']:
+            raise CommandError('Set MODEL_SERVER_SOCKET or pass --socket')
+
+        # always a local registry, this process is the one holding the models
+        registry = ModelRegistry()
+
+        try:
+            server = ModelServer(
+                registry,
+                options['socket'],
+                authkey=settings.MODEL_SERVER_AUTHKEY.encode(),
+                concurrency={
+                    'encode': settings.INFERENCE_WORKERS,
+                    'transcribe': settings.INGEST_INFERENCE_WORKERS
+                }
+            )
+        except ModelServerError as e:
+            raise CommandError(str(e))
+
+        if not options['lazy']:
+            registry.preload(['whisper', 'semantic'])
+
+        self.stdout.write(self.style.SUCCESS(f"Model server listening on {options['socket']}"))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.6 on 2026-10-17 06:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Video',
+            fields=[
+                ('video_id', models.CharField(max_length=36, primary_key=True, serialize=False)),
+                ('original_filename', models.CharField(max_length=255)),
+                ('title', models.CharField(max_length=255)),
+                ('file_size', models.BigIntegerField(default=0)),
+                ('duration', models.FloatField(default=0)),
+                ('width', models.IntegerField(default=0)),
+                ('height', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(db_index=True)),
+                ('processing_status', models.CharField(default='queued', max_length=20)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
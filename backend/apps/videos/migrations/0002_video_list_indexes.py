@@ -0,0 +1,38 @@
+# Generated by Django 5.1.6 on 2026-10-17 06:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='video',
+            name='created_at',
+            field=models.DateTimeField(),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['created_at', 'video_id'], name='video_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['duration', 'video_id'], name='video_duration_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['file_size', 'video_id'], name='video_file_size_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['processing_status', 'created_at'], name='video_status_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['title'], name='video_title_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+from django.db import migrations, models
+
+
+def fill_title_keys(apps, schema_editor):
+    Video = apps.get_model('videos', 'Video')
+
+    videos = list(Video.objects.only('video_id', 'title'))
+    for video in videos:
+        video.title_key = video.title.lower()[:255]
+
+    Video.objects.bulk_update(videos, ['title_key'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0003_video_sha256'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='title_key',
+            field=models.CharField(default='', max_length=255),
+        ),
+        migrations.RunPython(fill_title_keys, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='video',
+            name='video_title_idx',
+        ),
+        migrations.AddIndex(
+            model_name='video',
+            index=models.Index(fields=['title_key'], name='video_title_key_idx'),
+        ),
+    ]
@@ -0,0 +1,74 @@
+from django.db import models
+from typing import Any, Dict
+
+
+class Video(models.Model):
+    """Catalog entry for an uploaded video, written at ingest time"""
+
+    video_id = models.CharField(primary_key=True, max_length=36)
+    original_filename = models.CharField(max_length=255)
+    title = models.CharField(max_length=255)
+    # lowercased title, filtered by prefix as a range so the index is used
+    title_key = models.CharField(max_length=255, default='')
+    file_size = models.BigIntegerField(default=0)
+    duration = models.FloatField(default=0)
+    width = models.IntegerField(default=0)
+    height = models.IntegerField(default=0)
+    created_at = models.DateTimeField()
+    processing_status = models.CharField(max_length=20, default='queued')
+    # SHA-256 of the uploaded file, hashed while it streamed in
+    sha256 = models.CharField(max_length=64, blank=True, default='', db_index=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        # keyset pagination scans (sort field, video_id)
+        indexes = [
+            models.Index(fields=['created_at', 'video_id'], name='video_created_at_id_idx'),
+            models.Index(fields=['duration', 'video_id'], name='video_duration_id_idx'),
+            models.Index(fields=['file_size', 'video_id'], name='video_file_size_id_idx'),
+            models.Index(fields=['processing_status', 'created_at'], name='video_status_created_at_idx'),
+            models.Index(fields=['title_key'], name='video_title_key_idx'),
+        ]
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        self.title_key = self.normalize_title(self.title)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'title' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'title_key'}
+
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def normalize_title(title: str) -> str:
+        """Normalize a title or title prefix for title_key comparisons
+
+        Args:
+            title: Title or prefix to normalize
+
+        Returns:
+            The lowercased title, cut to the column length
+        """
+        return title.lower()[:255]
+
+    def __str__(self) -> str:
+        return f"{self.title} ({self.video_id})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the entry in the shape returned by the listing API
+
+        Returns:
+            Dictionary of video metadata with an ISO formatted created_at
+        """
+        return {
+            'video_id': self.video_id,
+            'original_filename': self.original_filename,
+            'title': self.title,
+            'file_size': self.file_size,
+            'duration': self.duration,
+            'width': self.width,
+            'height': self.height,
+            'created_at': self.created_at.isoformat(),
+            'processing_status': self.processing_status,
+            'sha256': self.sha256
+        }
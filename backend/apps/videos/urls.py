@@ -7,8 +7,10 @@ urlpatterns = [
     path('upload', views.upload_video, name='upload_video'),
     path('get', views.get_videos, name='get_videos'),
     path('search', views.search_video, name='search_video'),
+    path('search/library', views.search_library, name='search_library'),
     path('stream/<str:video_id>', views.stream_video, name='stream_video'),
     path('status/<str:video_id>', views.get_processing_status, name='video_status'),
     path('delete/<str:video_id>', views.delete_video, name='delete_video'),
     path('thumbnail/<str:video_id>', views.get_thumbnail, name='get_thumbnail'),
+    path('cache/stats', views.get_cache_stats, name='cache_stats'),
 ]
\ No newline at end of file
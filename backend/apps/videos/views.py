@@ -1,35 +1,48 @@
 from django.http import JsonResponse, HttpResponse, StreamingHttpResponse, FileResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.core.files.storage import default_storage
-from django.core.files.base import ContentFile
 from django.http.request import HttpRequest
+import asyncio
 import uuid
 import json
-from services.video_service import VideoService
+from services.video_service import get_video_service
+from services.processing_queue import ProcessingQueueFull
+from services.inference_executor import InferenceQueueFull
+from services.cache_service import CacheService
 import os
+import shutil
 from django.conf import settings
 from utils.validators import validate_video_file
-from wsgiref.util import FileWrapper
+from utils.upload_handlers import StagedVideoFile, get_upload_error
+from utils.streaming import sendfile_response
+from utils.http_range import ranged_file_response
 from typing import Tuple, Dict, Any, List, Optional, Union, BinaryIO
 
 
-video_service = VideoService()
+video_service = get_video_service()
 
 @csrf_exempt
 async def upload_video(request: HttpRequest) -> JsonResponse:
-    """Handle video upload
+    """Handle video upload and queue it for background processing
     
     Args:
         request: HTTP request object with video file
         
     Returns:
-        JSON response with video metadata or error
+        JSON response with the queued video record or error
     """
     if request.method != 'POST':
         return JsonResponse({'error': 'Method not allowed'}, status=405)
 
     try:
-        video_file = request.FILES.get('video')
+        # parsing streams the body to disk, keep it off the event loop
+        files = await asyncio.to_thread(lambda: request.FILES)
+        
+        upload_error = get_upload_error(request)
+        if upload_error:
+            return JsonResponse({'error': upload_error}, status=400)
+        
+        video_file = files.get('video')
         video_title = request.POST.get('title', '')
         
         
@@ -41,10 +54,11 @@ async def upload_video(request: HttpRequest) -> JsonResponse:
         if not video_file:
             return JsonResponse({'error': 'No video file provided'}, status=400)
 
-        # validate file
-        is_valid, error_message = validate_video_file(video_file)
-        if not is_valid:
-            return JsonResponse({'error': error_message}, status=400)
+        # files staged by VideoUploadHandler were validated while streaming
+        if not isinstance(video_file, StagedVideoFile):
+            is_valid, error_message = validate_video_file(video_file)
+            if not is_valid:
+                return JsonResponse({'error': error_message}, status=400)
 
         video_id = str(uuid.uuid4())
         
@@ -52,35 +66,33 @@ async def upload_video(request: HttpRequest) -> JsonResponse:
         if not os.path.exists(videos_dir):
             os.makedirs(videos_dir)
         
-        # store file 
-        file_path = default_storage.save(
+        # store file, staged uploads are renamed into place and others copied in chunks
+        file_path = await asyncio.to_thread(
+            default_storage.save,
             f'videos/{video_id}/{video_title}', 
-            ContentFile(video_file.read())
+            video_file
         )
         
         abs_file_path = os.path.join(settings.MEDIA_ROOT, file_path)
         
-        # process video
-        result = await video_service.process_video(
-            abs_file_path, 
-            video_id,
-            original_filename=video_title
-        )
-        
-        if not result['success']:
-            # clean up if processing failed
-            default_storage.delete(file_path)
-            return JsonResponse({'error': result['error']}, status=400)
+        # queue video for background processing
+        try:
+            record = await video_service.enqueue_video(
+                abs_file_path, 
+                video_id,
+                original_filename=video_title,
+                sha256=video_file.sha256 if isinstance(video_file, StagedVideoFile) else None
+            )
+        except ProcessingQueueFull as e:
+            await asyncio.to_thread(shutil.rmtree, os.path.join(videos_dir, video_id), True)
+            return JsonResponse({'error': str(e)}, status=503)
 
         return JsonResponse({
-            'video_id': result['video_id'],
-            'duration': result['duration'],
-            'file_size': result['file_size'],
-            'width': result['width'],
-            'height': result['height'],
-            'created_at': result['created_at'],
-            'processing_status': result['processing_status']
-        })
+            'video_id': record['video_id'],
+            'created_at': record['created_at'],
+            'processing_status': record['processing_status'],
+            'processing_progress': record['processing_progress']
+        }, status=202)
 
     except Exception as e:
         print(f"Upload error: {str(e)}")
@@ -90,27 +102,54 @@ async def upload_video(request: HttpRequest) -> JsonResponse:
 
 @csrf_exempt
 async def get_videos(request: HttpRequest) -> JsonResponse:
-    """Get all videos
+    """Get one page of videos
     
     Args:
-        request: HTTP request object with optional limit parameter
+        request: HTTP request object with optional query parameters:
+            limit, cursor, sort (created_at, duration or size),
+            order (asc or desc), status, min_duration, max_duration
+            and title_prefix
         
     Returns:
-        JSON response with list of videos or error
+        JSON response with list of videos and next page cursor or error
     """
     if request.method != 'GET':
         return JsonResponse({'error': 'Method not allowed'}, status=405)
 
     try:
-        # get query params if any
-        limit = request.GET.get('limit')
-        print("type of limit ", type(limit))
-        limit = int(limit) if limit and limit.isdigit() else None
+        params = request.GET
+        
+        limit = params.get('limit', '')
+        limit = int(limit) if limit.isdigit() and int(limit) > 0 else settings.VIDEO_LIST_DEFAULT_LIMIT
+        limit = min(limit, settings.VIDEO_LIST_MAX_LIMIT)
+        
+        sort = params.get('sort', 'created_at')
+        if sort == 'size':
+            sort = 'file_size'
         
-        # get all video IDs
-        videos = await video_service.get_all_videos(limit=limit)
-        if not videos:
-            return JsonResponse({'videos': []})
+        order = params.get('order', 'desc')
+        if order not in ('asc', 'desc'):
+            return JsonResponse({'error': 'order must be asc or desc'}, status=400)
+        
+        try:
+            min_duration = float(params['min_duration']) if params.get('min_duration') else None
+            max_duration = float(params['max_duration']) if params.get('max_duration') else None
+        except ValueError:
+            return JsonResponse({'error': 'min_duration and max_duration must be numbers'}, status=400)
+        
+        try:
+            page = await video_service.get_all_videos(
+                limit,
+                sort=sort,
+                descending=order == 'desc',
+                cursor=params.get('cursor') or None,
+                status=params.get('status') or None,
+                min_duration=min_duration,
+                max_duration=max_duration,
+                title_prefix=params.get('title_prefix') or None
+            )
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
 
         # format the response to match frontend 
         formatted_videos = [{
@@ -121,10 +160,14 @@ async def get_videos(request: HttpRequest) -> JsonResponse:
             'width': video['width'],
             'height': video['height'],
             'created_at': video['created_at'],
-            'processing_status': video['processing_status']
-        } for video in videos]
+            'processing_status': video['processing_status'],
+            'processing_progress': video['processing_progress']
+        } for video in page['videos']]
 
-        return JsonResponse({'videos': formatted_videos})
+        return JsonResponse({
+            'videos': formatted_videos,
+            'next_cursor': page['next_cursor']
+        })
 
     except Exception as e:
         print(f"Error fetching videos: {str(e)}")
@@ -134,7 +177,7 @@ async def get_videos(request: HttpRequest) -> JsonResponse:
 
 @csrf_exempt
 async def stream_video(request: HttpRequest, video_id: str) -> Union[StreamingHttpResponse, HttpResponse]:
-    """Stream video file with range request support
+    """Stream video file with range and conditional request support
     
     Args:
         request: HTTP request object
@@ -143,7 +186,7 @@ async def stream_video(request: HttpRequest, video_id: str) -> Union[StreamingHt
     Returns:
         Streaming response with video data or error response
     """
-    if request.method != 'GET':
+    if request.method not in ('GET', 'HEAD'):
         return HttpResponse('Method not allowed', status=405)
         
     try:
@@ -152,58 +195,24 @@ async def stream_video(request: HttpRequest, video_id: str) -> Union[StreamingHt
             return HttpResponse('Video not found', status=404)
         
         file_path = video_info['file_path']
-        file_size = video_info['file_size']
         content_type = video_info['content_type']
+        filename = video_info['filename']
         
-        file_obj = open(file_path, 'rb')
-        
-        # handle range header
-        range_header = request.META.get('HTTP_RANGE', '')
+        # a front proxy can send the file itself, ranges included
+        response = sendfile_response(file_path, content_type)
+        if response is not None:
+            response['Cache-Control'] = f'public, max-age={settings.VIDEO_CACHE_MAX_AGE}, immutable'
+            response['Content-Disposition'] = f'inline; filename="{filename}"'
+            return response
         
-        if range_header:
-            bytes_range = range_header.replace('bytes=', '').split('-')
-            start_byte = int(bytes_range[0])
-            end_byte = int(bytes_range[1]) if bytes_range[1] else file_size - 1
-            
-            if start_byte >= file_size:
-                return HttpResponse(
-                    'Requested range not satisfiable',
-                    status=416,
-                    headers={'Content-Range': f'bytes */{file_size}'}
-                )
-                
-            chunk_size = end_byte - start_byte + 1
-            file_obj.seek(start_byte)
-            
-            response = StreamingHttpResponse(
-                FileWrapper(file_obj, chunk_size),
-                status=206,
-                content_type=content_type
-            )
-            
-            response['Content-Length'] = str(chunk_size)
-            response['Content-Range'] = f'bytes {start_byte}-{end_byte}/{file_size}'
-            response['Accept-Ranges'] = 'bytes'
-            
-        else:
-            response = StreamingHttpResponse(
-                FileWrapper(file_obj),
-                content_type=content_type
-            )
-            response['Content-Length'] = str(file_size)
-            response['Accept-Ranges'] = 'bytes'
-        
-        # headers for streaming
-        response['Cache-Control'] = 'no-cache'
-        filename = video_info['filename']
+        # ranges, validators and caching headers
+        response = ranged_file_response(request, file_path, content_type)
         response['Content-Disposition'] = f'inline; filename="{filename}"'
         
         return response
             
     except Exception as e:
         print(f"Streaming error: {str(e)}")
-        if 'file_obj' in locals():
-            file_obj.close()
         return HttpResponse('Error streaming video', status=500)
 
 @csrf_exempt
@@ -233,10 +242,28 @@ async def search_video(request: HttpRequest) -> JsonResponse:
         if not video_info:
             return JsonResponse({'error': 'Video not found'}, status=404)
 
-        result = await video_service.transcript_service.search_transcript(
-            query, 
-            video_info['transcript']
-        )
+        # a replayed query is answered before the transcript and embeddings are loaded
+        result = None
+        if video_info.get('transcript_version'):
+            result = await video_service.get_cached_search(
+                video_id,
+                video_info['transcript_version'],
+                query
+            )
+
+        if result is None:
+            transcript = await video_service.get_transcript(video_id)
+            if transcript is None:
+                return JsonResponse({
+                    'error': 'Video is still processing',
+                    'processing_status': video_info.get('processing_status')
+                }, status=409)
+
+            result = await video_service.search_video(
+                video_id,
+                query, 
+                transcript
+            )
         print("result is here", result)
 
         if not result:
@@ -249,9 +276,47 @@ async def search_video(request: HttpRequest) -> JsonResponse:
             'count': len(result)
         })
 
+    except InferenceQueueFull as e:
+        return JsonResponse({'error': str(e)}, status=503)
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
     
+@csrf_exempt
+async def search_library(request: HttpRequest) -> JsonResponse:
+    """Search transcripts across all videos
+    
+    Args:
+        request: HTTP request object with query and optional limit
+        
+    Returns:
+        JSON response with video_id and timestamp hits or error
+    """
+    if request.method != 'POST':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        data = json.loads(request.body)
+        query = data.get('query')
+        limit = data.get('limit', 10)
+
+        if not query:
+            return JsonResponse({'error': 'query is required'}, status=400)
+
+        if not isinstance(limit, int) or limit <= 0:
+            return JsonResponse({'error': 'limit must be a positive integer'}, status=400)
+
+        results = await video_service.search_library(query, limit=min(limit, 100))
+
+        return JsonResponse({
+            'results': results,
+            'count': len(results)
+        })
+
+    except InferenceQueueFull as e:
+        return JsonResponse({'error': str(e)}, status=503)
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
+
 @csrf_exempt
 async def delete_video(request: HttpRequest, video_id: str) -> JsonResponse:
     """Delete a video and its associated data
@@ -289,7 +354,7 @@ async def get_thumbnail(request: HttpRequest, video_id: str) -> Union[FileRespon
     Returns:
         File response with thumbnail or error response
     """
-    if request.method != 'GET':
+    if request.method not in ('GET', 'HEAD'):
         return HttpResponse('Method not allowed', status=405)
         
     try:
@@ -332,3 +397,25 @@ async def get_processing_status(request: HttpRequest, video_id: str) -> JsonResp
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
 
+
+@csrf_exempt
+async def get_cache_stats(request: HttpRequest) -> JsonResponse:
+    """Get this process's Redis connection pool and in-process cache usage
+    
+    Args:
+        request: HTTP request object
+        
+    Returns:
+        JSON response with redis_pool and l1 counters or error
+    """
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        return JsonResponse({
+            'redis_pool': CacheService.pool_stats(),
+            'l1': CacheService.l1_stats()
+        })
+
+    except Exception as e:
+        return JsonResponse({'error': str(e)}, status=500)
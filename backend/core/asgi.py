@@ -9,6 +9,7 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
@@ -24,3 +25,9 @@ application = ProtocolTypeRouter({
     ),
 })
 
+if settings.VIDEO_PROCESSING_RECOVER_ON_STARTUP:
+    from services.video_service import get_video_service
+
+    # processing jobs run in this process, pick up what the last run left unfinished
+    get_video_service().recover_interrupted_videos()
+
@@ -124,12 +124,14 @@ TEMPLATES = [
 WSGI_APPLICATION = 'core.wsgi.application'
 ASGI_APPLICATION = 'core.asgi.application'
 
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379')
+
 #? Channel Layers Configuration
 CHANNEL_LAYERS = {
     'default': {
         'BACKEND': 'channels_redis.core.RedisChannelLayer',
         'CONFIG': {
-            "hosts": [os.getenv('REDIS_URL', 'redis://localhost:6379')],
+            "hosts": [REDIS_URL],
         },
     },
 }
@@ -138,17 +140,141 @@ CHANNEL_LAYERS = {
 CACHES = {
     'default': {
         'BACKEND': 'django_redis.cache.RedisCache',
-        'LOCATION': os.getenv('REDIS_URL', 'redis://localhost:6379'),
+        'LOCATION': REDIS_URL,
         'OPTIONS': {
             'CLIENT_CLASS': 'django_redis.client.DefaultClient',
         }
     }
 }
 
+#? Async Cache Client
+# CacheService talks to Redis through redis.asyncio, one pool per event loop
+CACHE_REDIS_MAX_CONNECTIONS = int(os.getenv('CACHE_REDIS_MAX_CONNECTIONS', 50))
+CACHE_REDIS_SOCKET_TIMEOUT = float(os.getenv('CACHE_REDIS_SOCKET_TIMEOUT', 5))
+
+#? In-process Cache
+# hot records kept in worker memory in front of Redis, evicted via pub/sub on writes
+CACHE_L1_ENABLED = os.getenv('CACHE_L1_ENABLED', 'false').lower() == 'true'
+CACHE_L1_KEY_PREFIXES = tuple(os.getenv('CACHE_L1_KEY_PREFIXES', 'video_,transcript_,embeddings_').split(','))
+CACHE_L1_MAX_ENTRIES = int(os.getenv('CACHE_L1_MAX_ENTRIES', 10000))
+CACHE_L1_MAX_BYTES = int(os.getenv('CACHE_L1_MAX_BYTES', 64 * 1024 * 1024))
+CACHE_L1_TTL = float(os.getenv('CACHE_L1_TTL', 60))
+CACHE_L1_INVALIDATION_CHANNEL = os.getenv('CACHE_L1_INVALIDATION_CHANNEL', 'cache_invalidation')
+
 #? File Upload Settings
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# uploaded videos are streamed to disk chunk by chunk, other files use Django's defaults
+FILE_UPLOAD_HANDLERS = [
+    'utils.upload_handlers.VideoUploadHandler',
+    'django.core.files.uploadhandler.MemoryFileUploadHandler',
+    'django.core.files.uploadhandler.TemporaryFileUploadHandler',
+]
+# kept under MEDIA_ROOT so finished uploads are renamed into place, not copied
+VIDEO_UPLOAD_STAGING_DIR = os.path.join(MEDIA_ROOT, 'uploads')
+VIDEO_UPLOAD_CHUNK_SIZE = int(os.getenv('VIDEO_UPLOAD_CHUNK_SIZE', 256 * 1024))
+
+#? Media Probe
+# ffprobe reads container metadata without decoding, OpenCV is used if it is missing
+FFPROBE_BINARY = os.getenv('FFPROBE_BINARY', 'ffprobe')
+FFPROBE_TIMEOUT = float(os.getenv('FFPROBE_TIMEOUT', 30))
+
+#? Audio Extraction
+# audio is decoded once to 16 kHz mono PCM beside each video and reused for transcription
+FFMPEG_BINARY = os.getenv('FFMPEG_BINARY', 'ffmpeg')
+FFMPEG_TIMEOUT = float(os.getenv('FFMPEG_TIMEOUT', 300))
+
+#? Chunked Transcription
+# long audio is cut at pauses into windows transcribed in parallel worker processes
+CHUNKED_TRANSCRIPTION_ENABLED = os.getenv('CHUNKED_TRANSCRIPTION_ENABLED', 'false').lower() == 'true'
+TRANSCRIPTION_WORKERS = int(os.getenv('TRANSCRIPTION_WORKERS', 4))
+TRANSCRIPTION_WINDOW_SECONDS = float(os.getenv('TRANSCRIPTION_WINDOW_SECONDS', 30))
+# audio re-read before each cut so words at the seam are heard whole
+TRANSCRIPTION_OVERLAP_SECONDS = float(os.getenv('TRANSCRIPTION_OVERLAP_SECONDS', 1))
+# how far from each window boundary to look for the quietest point
+TRANSCRIPTION_SPLIT_SEARCH_SECONDS = float(os.getenv('TRANSCRIPTION_SPLIT_SEARCH_SECONDS', 5))
+
+#? Partial Transcripts
+# audio longer than one TRANSCRIPTION_WINDOW_SECONDS window is transcribed window by
+# window (in parallel with chunked transcription, otherwise one after another) and each
+# window's segments are stored, indexed and broadcast while the rest is transcribing;
+# set to false to transcribe uploads in a single Whisper pass
+TRANSCRIPT_PARTIAL_UPDATES = os.getenv('TRANSCRIPT_PARTIAL_UPDATES', 'true').lower() == 'true'
+
+#? Models
+# loaded once per process on first use, see services/model_registry.py
+WHISPER_MODEL = os.getenv('WHISPER_MODEL', 'base')
+SPACY_MODEL = os.getenv('SPACY_MODEL', 'en_core_web_sm')
+# changing this changes embedding sizes, run reembed_videos afterwards
+SEMANTIC_MODEL = os.getenv('SEMANTIC_MODEL', 'all-MiniLM-L6-v2')
+
+#? Shared Model Server
+# Unix socket of a `run_model_server` process that runs Whisper and the embedding
+# model for every worker; leave empty to load them in each process
+MODEL_SERVER_SOCKET = os.getenv('MODEL_SERVER_SOCKET', '')
+# required, the server and its clients refuse to run without one
+MODEL_SERVER_AUTHKEY = os.getenv('MODEL_SERVER_AUTHKEY', SECRET_KEY or '')
+MODEL_SERVER_TIMEOUT = float(os.getenv('MODEL_SERVER_TIMEOUT', 300))
+
+#? Model Inference Executor
+INFERENCE_WORKERS = int(os.getenv('INFERENCE_WORKERS', 2))
+# model calls allowed to wait for a worker before callers are rejected
+INFERENCE_MAX_QUEUE = int(os.getenv('INFERENCE_MAX_QUEUE', 32))
+INFERENCE_QUEUE_TIMEOUT = float(os.getenv('INFERENCE_QUEUE_TIMEOUT', 10))
+# transcription and segment embedding run on their own pool so queries never wait behind them
+INGEST_INFERENCE_WORKERS = int(os.getenv('INGEST_INFERENCE_WORKERS', 1))
+INGEST_INFERENCE_MAX_QUEUE = int(os.getenv('INGEST_INFERENCE_MAX_QUEUE', 8))
+INGEST_INFERENCE_QUEUE_TIMEOUT = float(os.getenv('INGEST_INFERENCE_QUEUE_TIMEOUT', 600))
+
+#? Transcript Segment Embedding
+SEGMENT_EMBEDDING_BATCH_SIZE = int(os.getenv('SEGMENT_EMBEDDING_BATCH_SIZE', 64))
+# storage dtype for cached embedding matrices: float32 or float16 (half the size)
+TRANSCRIPT_EMBEDDING_DTYPE = os.getenv('TRANSCRIPT_EMBEDDING_DTYPE', 'float16')
+
+#? Query Embedding Micro-batching
+# concurrent search queries arriving within the wait window are encoded together
+QUERY_BATCH_MAX_SIZE = int(os.getenv('QUERY_BATCH_MAX_SIZE', 32))
+QUERY_BATCH_MAX_WAIT_MS = float(os.getenv('QUERY_BATCH_MAX_WAIT_MS', 5))
+
+#? Query Cache
+# parsed question components and embeddings for repeated search queries
+QUERY_CACHE_MAX_SIZE = int(os.getenv('QUERY_CACHE_MAX_SIZE', 1024))
+QUERY_CACHE_TTL = float(os.getenv('QUERY_CACHE_TTL', 3600))
+
+#? Search Result Cache
+# per-video search responses, keyed on the transcript version
+SEARCH_RESULT_CACHE_TIMEOUT = int(os.getenv('SEARCH_RESULT_CACHE_TIMEOUT', 3600))
+
+#? Video Processing Queue
+VIDEO_PROCESSING_WORKERS = int(os.getenv('VIDEO_PROCESSING_WORKERS', 2))
+# uploads waiting for a worker before new ones are rejected
+VIDEO_PROCESSING_MAX_PENDING = int(os.getenv('VIDEO_PROCESSING_MAX_PENDING', 20))
+VIDEO_PROCESSING_MAX_RETRIES = int(os.getenv('VIDEO_PROCESSING_MAX_RETRIES', 2))
+VIDEO_PROCESSING_RETRY_DELAY = float(os.getenv('VIDEO_PROCESSING_RETRY_DELAY', 5))
+# requeue uploads a previous server run left queued or processing; with several
+# server processes sharing one database, enable it on one of them only
+VIDEO_PROCESSING_RECOVER_ON_STARTUP = os.getenv('VIDEO_PROCESSING_RECOVER_ON_STARTUP', 'true').lower() == 'true'
+
+#? Video Listing
+VIDEO_LIST_DEFAULT_LIMIT = int(os.getenv('VIDEO_LIST_DEFAULT_LIMIT', 50))
+VIDEO_LIST_MAX_LIMIT = int(os.getenv('VIDEO_LIST_MAX_LIMIT', 200))
+
+#? Video Streaming
+# bytes read and sent per chunk when streaming through the app
+VIDEO_STREAM_CHUNK_SIZE = int(os.getenv('VIDEO_STREAM_CHUNK_SIZE', 256 * 1024))
+# uploads never change once written, so players and CDNs may keep them this long
+VIDEO_CACHE_MAX_AGE = int(os.getenv('VIDEO_CACHE_MAX_AGE', 365 * 24 * 60 * 60))
+# 'X-Accel-Redirect' (nginx) or 'X-Sendfile' (Apache) to let the proxy send files, empty to stream here
+VIDEO_SENDFILE_HEADER = os.getenv('VIDEO_SENDFILE_HEADER', '')
+# internal nginx location mapped to MEDIA_ROOT, used with X-Accel-Redirect
+VIDEO_SENDFILE_PREFIX = os.getenv('VIDEO_SENDFILE_PREFIX', '/protected-media/')
+
+#? Library Search Index
+SEARCH_INDEX_DIR = os.path.join(MEDIA_ROOT, 'index')
+# number of IVF buckets scored per query once the index is trained
+SEARCH_INDEX_NPROBE = int(os.getenv('SEARCH_INDEX_NPROBE', 8))
+
 #? CORS Settings
 # CORS_ALLOWED_ORIGINS = [
 #     "http://localhost:3000",
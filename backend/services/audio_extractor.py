@@ -0,0 +1,115 @@
+from typing import Optional
+from django.conf import settings
+import numpy as np
+from numpy.typing import NDArray
+import os
+import subprocess
+
+
+class AudioExtractionError(Exception):
+    """Raised when ffmpeg cannot extract a video's audio"""
+
+
+class AudioExtractor:
+    """Decode a video's audio once into a raw 16 kHz mono PCM cache
+
+    The audio is written next to the video as signed 16-bit little-endian
+    samples at Whisper's sample rate, 32 KB per second of video. Loading it
+    is a memory map and one dtype conversion, so re-transcribing never
+    touches the video container again.
+    """
+
+    # Whisper's input format
+    SAMPLE_RATE: int = 16000
+    AUDIO_FILENAME: str = 'audio.pcm'
+
+    @staticmethod
+    def audio_path(video_path: str) -> str:
+        """Get where a video's audio cache lives
+
+        Args:
+            video_path: Path to the video file
+
+        Returns:
+            Path of the PCM file in the video's directory
+        """
+        return os.path.join(os.path.dirname(video_path), AudioExtractor.AUDIO_FILENAME)
+
+    @staticmethod
+    def extract(video_path: str, force: bool = False) -> str:
+        """Extract a video's audio unless an up-to-date cache exists
+
+        Args:
+            video_path: Path to the video file
+            force: Re-extract even if the cache is present
+
+        Returns:
+            Path to the PCM audio file
+
+        Raises:
+            AudioExtractionError: If ffmpeg fails
+        """
+        audio_path = AudioExtractor.audio_path(video_path)
+
+        if not force and os.path.exists(audio_path) and (
+            os.path.getmtime(audio_path) >= os.path.getmtime(video_path)
+        ):
+            return audio_path
+
+        # write beside the target and rename, so readers never see a partial file
+        partial_path = f'{audio_path}.part'
+        result = subprocess.run(
+            [
+                settings.FFMPEG_BINARY,
+                '-nostdin', '-y', '-threads', '0',
+                '-i', video_path,
+                '-vn', '-ac', '1', '-ar', str(AudioExtractor.SAMPLE_RATE),
+                '-f', 's16le', '-acodec', 'pcm_s16le',
+                partial_path
+            ],
+            capture_output=True,
+            timeout=settings.FFMPEG_TIMEOUT,
+            check=False
+        )
+
+        if result.returncode != 0:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise AudioExtractionError(
+                f"ffmpeg failed: {result.stderr.decode(errors='replace').strip()[-500:]}"
+            )
+
+        os.replace(partial_path, audio_path)
+        return audio_path
+
+    @staticmethod
+    def load(audio_path: str, offset: int = 0, count: Optional[int] = None) -> NDArray[np.float32]:
+        """Load cached audio as Whisper's float32 input
+
+        Args:
+            audio_path: Path to the PCM audio file
+            offset: First sample to load
+            count: Number of samples to load (default to the end)
+
+        Returns:
+            float32 samples in [-1, 1)
+        """
+        if os.path.getsize(audio_path) == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        samples = np.memmap(audio_path, dtype='<i2', mode='r')
+        end = len(samples) if count is None else min(offset + count, len(samples))
+
+        return samples[offset:end].astype(np.float32) / 32768.0
+
+    @staticmethod
+    def duration(audio_path: str) -> float:
+        """Get the length of cached audio in seconds
+
+        Args:
+            audio_path: Path to the PCM audio file
+
+        Returns:
+            Duration in seconds
+        """
+        return os.path.getsize(audio_path) / 2 / AudioExtractor.SAMPLE_RATE
@@ -1,25 +1,265 @@
+from django.conf import settings
 from django.core.cache import cache
+from redis.asyncio import ConnectionPool, Redis
 from typing import Any, Optional, List, Set, Union, Dict
+from .lru_cache import LRUCache
+from datetime import datetime, timezone
+from numpy.typing import NDArray
+import numpy as np
+import asyncio
+import redis
+import io
 import json
+import pickle
+import threading
+import time
 
 class CacheService:
     """Service for handling cache operations with type-safe methods"""
-    
+
     CacheableValue = Union[str, int, float, bool, Dict[str, Any], List[Any], None]
-    
+
+    # sorted set of video_* keys scored by created_at, replaces the pickled all_video_keys set
+    VIDEO_KEYS_INDEX: str = 'video_keys_index'
+    _legacy_keys_migrated: bool = False
+
+    # one pool per event loop, asyncio connections cannot be shared between loops;
+    # open connections reference their loop, so short-lived loops must call close_client
+    _clients: Dict[asyncio.AbstractEventLoop, Redis] = {}
+    _clients_lock = threading.Lock()
+
+    # optional in-process copy of hot records, see _l1
+    _l1_cache: Optional[LRUCache[str, Any]] = None
+    _l1_lock = threading.Lock()
+    _l1_subscribed = threading.Event()
+    # bumped on every invalidation, guards fills racing with a write
+    _l1_generation: int = 0
+
+    @staticmethod
+    def _client() -> Redis:
+        """Get the Redis client bound to the running event loop
+
+        Returns:
+            Redis: Async client backed by a pool of at most
+            CACHE_REDIS_MAX_CONNECTIONS connections
+        """
+        loop = asyncio.get_running_loop()
+
+        with CacheService._clients_lock:
+            client = CacheService._clients.get(loop)
+            if client is None:
+                pool = ConnectionPool.from_url(
+                    settings.REDIS_URL,
+                    max_connections=settings.CACHE_REDIS_MAX_CONNECTIONS,
+                    socket_timeout=settings.CACHE_REDIS_SOCKET_TIMEOUT,
+                    socket_connect_timeout=settings.CACHE_REDIS_SOCKET_TIMEOUT
+                )
+                client = CacheService._clients[loop] = Redis(connection_pool=pool)
+
+            return client
+
+    @staticmethod
+    async def close_client() -> None:
+        """Close the running event loop's client and its connection pool
+
+        Note:
+            Call this before a short-lived event loop (asyncio.run) ends,
+            otherwise its pool and open sockets are never released.
+        """
+        loop = asyncio.get_running_loop()
+
+        with CacheService._clients_lock:
+            client = CacheService._clients.pop(loop, None)
+
+        if client is not None:
+            await client.aclose(close_connection_pool=True)
+
+    @staticmethod
+    def pool_stats() -> Dict[str, Optional[int]]:
+        """Get connection pool usage across every event loop
+
+        Returns:
+            Dict with pools, max_connections, in_use, idle and created
+            (connections currently open) counts; the last three are None
+            if this redis-py version does not expose them
+        """
+        with CacheService._clients_lock:
+            pools = [client.connection_pool for client in CacheService._clients.values()]
+
+        # redis-py has no public counters, its connection sets are read defensively
+        in_use = CacheService._count_connections(pools, '_in_use_connections')
+        idle = CacheService._count_connections(pools, '_available_connections')
+
+        return {
+            'pools': len(pools),
+            'max_connections': settings.CACHE_REDIS_MAX_CONNECTIONS,
+            'in_use': in_use,
+            'idle': idle,
+            'created': in_use + idle if in_use is not None and idle is not None else None
+        }
+
+    @staticmethod
+    def _count_connections(pools: List[ConnectionPool], attribute: str) -> Optional[int]:
+        try:
+            return sum(len(getattr(pool, attribute)) for pool in pools)
+        except (AttributeError, TypeError):
+            return None
+
+    @staticmethod
+    def l1_stats() -> Dict[str, int]:
+        """Get in-process cache counters
+
+        Returns:
+            Dict with hits, misses, size, max_size and bytes, empty when
+            the in-process cache is disabled
+        """
+        l1 = CacheService._l1_cache
+        return l1.stats() if l1 is not None else {}
+
+    @staticmethod
+    def _l1(key: str) -> Optional[LRUCache[str, Any]]:
+        """Get the in-process cache if it applies to a key
+
+        Args:
+            key: Cache key being read or written
+
+        Returns:
+            The process-wide LRU cache, or None when disabled, when the key
+            is not one of CACHE_L1_KEY_PREFIXES, or while the invalidation
+            listener is not subscribed
+
+        Note:
+            Values served from here are shared between callers and must not
+            be mutated.
+        """
+        if not settings.CACHE_L1_ENABLED or not key.startswith(settings.CACHE_L1_KEY_PREFIXES):
+            return None
+
+        if CacheService._l1_cache is None:
+            with CacheService._l1_lock:
+                if CacheService._l1_cache is None:
+                    CacheService._l1_cache = LRUCache(
+                        settings.CACHE_L1_MAX_ENTRIES,
+                        ttl=settings.CACHE_L1_TTL,
+                        max_bytes=settings.CACHE_L1_MAX_BYTES
+                    )
+                    threading.Thread(
+                        target=CacheService._listen_for_invalidations,
+                        name='cache-invalidation',
+                        daemon=True
+                    ).start()
+
+        # without the listener other workers' writes would go unnoticed
+        if not CacheService._l1_subscribed.is_set():
+            return None
+
+        return CacheService._l1_cache
+
+    @staticmethod
+    def _l1_fill(key: str, value: Any, size: int, generation: int) -> None:
+        """Store a value just read from Redis unless it was invalidated meanwhile"""
+        l1 = CacheService._l1(key)
+        if l1 is None or value is None:
+            return
+
+        with CacheService._l1_lock:
+            if generation == CacheService._l1_generation:
+                l1.set(key, value, size)
+
+    @staticmethod
+    def _l1_invalidate(keys: List[str]) -> None:
+        """Drop keys from this process's in-process cache"""
+        l1 = CacheService._l1_cache
+        if l1 is None:
+            return
+
+        with CacheService._l1_lock:
+            CacheService._l1_generation += 1
+            for key in keys:
+                l1.delete(key)
+
+    @staticmethod
+    def _publish_invalidation(pipe: Any, keys: List[str]) -> None:
+        """Queue a message telling every worker to drop keys from its in-process cache"""
+        keys = [key for key in keys if key.startswith(settings.CACHE_L1_KEY_PREFIXES)]
+
+        if settings.CACHE_L1_ENABLED and keys:
+            # our own message arrives after the write too, evicting any fill that raced it
+            CacheService._l1_invalidate(keys)
+            pipe.publish(settings.CACHE_L1_INVALIDATION_CHANNEL, json.dumps(keys))
+
+    @staticmethod
+    def _listen_for_invalidations() -> None:
+        """Evict keys written by any worker, runs forever on a daemon thread
+
+        Note:
+            Messages published while disconnected are lost, so the whole
+            in-process cache is dropped and bypassed until resubscribed.
+        """
+        while True:
+            try:
+                client = redis.Redis.from_url(settings.REDIS_URL, health_check_interval=30)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(settings.CACHE_L1_INVALIDATION_CHANNEL)
+                CacheService._l1_subscribed.set()
+
+                for message in pubsub.listen():
+                    CacheService._l1_invalidate(json.loads(message['data']))
+
+            except Exception as e:
+                print(f"Cache invalidation listener error: {e}")
+
+            CacheService._l1_subscribed.clear()
+            CacheService._l1_invalidate([])
+            CacheService._l1_cache.clear()
+            time.sleep(1)
+
+    @staticmethod
+    def _make_key(key: str) -> str:
+        # same key layout as the django cache, so both see the same entries
+        return cache.make_key(key)
+
+    @staticmethod
+    def _encode(value: Any) -> Union[int, bytes]:
+        """Serialize a value the way django-redis does, integers stay plain"""
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+        return pickle.dumps(value, pickle.DEFAULT_PROTOCOL)
+
+    @staticmethod
+    def _decode(raw: Optional[bytes]) -> Any:
+        """Deserialize a value stored by _encode or django-redis"""
+        if raw is None:
+            return None
+        try:
+            return int(raw)
+        except (ValueError, TypeError):
+            return pickle.loads(raw)
+
+    @staticmethod
+    def _parse_json(value: Any) -> Any:
+        """Parse dicts and lists stored as JSON strings"""
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                return value
+
+        return value
+
     @staticmethod
     async def set(
-        key: str, 
-        value: CacheableValue, 
+        key: str,
+        value: CacheableValue,
         timeout: int = 86400
     ) -> bool:
         """Set a value in cache
-        
+
         Args:
             key: Cache key to store value under
             value: Value to store (must be JSON serializable)
             timeout: Cache timeout in seconds (default 24 hours)
-            
+
         Returns:
             bool: True if successful, False if error occurred
         """
@@ -27,84 +267,323 @@ class CacheService:
             if isinstance(value, (dict, list)):
                 value = json.dumps(value)
 
-            if key.startswith('video_'):
-                all_keys = cache.get('all_video_keys', set())
-                all_keys.add(key)
-                cache.set('all_video_keys', all_keys)
-                
-            cache.set(key, value, timeout)
+            async with CacheService._client().pipeline(transaction=False) as pipe:
+                pipe.set(CacheService._make_key(key), CacheService._encode(value), ex=timeout)
+                CacheService._track_video_keys(pipe, {key: value})
+                CacheService._publish_invalidation(pipe, [key])
+                await pipe.execute()
+
             return True
-        
+
         except Exception as e:
             print(f"Cache set error: {e}")
             return False
-    
+
     @staticmethod
     async def get(key: str) -> Optional[CacheableValue]:
         """Get a value from cache
-        
+
         Args:
             key: Cache key to retrieve
-            
+
         Returns:
             Optional[CacheableValue]: Retrieved value or None if not found/error
         """
         try:
-            value = cache.get(key)
-            
-            if isinstance(value, str):
-                try:
-                    return json.loads(value)
-                except json.JSONDecodeError:
+            l1 = CacheService._l1(key)
+            if l1 is not None:
+                value = l1.get(key)
+                if value is not None:
                     return value
-            
+
+            generation = CacheService._l1_generation
+            raw = await CacheService._client().get(CacheService._make_key(key))
+            value = CacheService._parse_json(CacheService._decode(raw))
+
+            if raw is not None:
+                CacheService._l1_fill(key, value, len(raw), generation)
             return value
-        
+
         except Exception as e:
             print(f"Cache get error: {e}")
             return None
 
     @staticmethod
-    async def delete(key: str) -> bool:
-        """Delete a value from cache
-        
+    async def get_many(keys: List[str]) -> Dict[str, CacheableValue]:
+        """Get several values from cache in one round trip
+
         Args:
-            key: Cache key to delete
-            
+            keys: Cache keys to retrieve
+
+        Returns:
+            Dict[str, CacheableValue]: Found keys mapped to their values,
+            missing keys are left out
+        """
+        try:
+            if not keys:
+                return {}
+
+            values = {}
+            for key in keys:
+                l1 = CacheService._l1(key)
+                value = l1.get(key) if l1 is not None else None
+                if value is not None:
+                    values[key] = value
+
+            missing = [key for key in keys if key not in values]
+            if not missing:
+                return values
+
+            generation = CacheService._l1_generation
+            raw_values = await CacheService._client().mget(
+                [CacheService._make_key(key) for key in missing]
+            )
+
+            for key, raw in zip(missing, raw_values):
+                if raw is not None:
+                    values[key] = CacheService._parse_json(CacheService._decode(raw))
+                    CacheService._l1_fill(key, values[key], len(raw), generation)
+
+            return values
+
+        except Exception as e:
+            print(f"Cache get_many error: {e}")
+            return {}
+
+    @staticmethod
+    async def set_many(
+        values: Dict[str, CacheableValue],
+        timeout: int = 86400
+    ) -> bool:
+        """Set several values in cache in one round trip
+
+        Args:
+            values: Cache keys mapped to values (must be JSON serializable)
+            timeout: Cache timeout in seconds (default 24 hours)
+
         Returns:
             bool: True if successful, False if error occurred
         """
         try:
-            if key.startswith('video_'):
-                all_keys = cache.get('all_video_keys', set())
-                all_keys.discard(key)
-                cache.set('all_video_keys', all_keys)
-            
-            cache.delete(key)
-            
+            if not values:
+                return True
+
+            async with CacheService._client().pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    if isinstance(value, (dict, list)):
+                        value = json.dumps(value)
+                    pipe.set(CacheService._make_key(key), CacheService._encode(value), ex=timeout)
+
+                CacheService._track_video_keys(pipe, values)
+                CacheService._publish_invalidation(pipe, list(values))
+                await pipe.execute()
+
             return True
-        
+
         except Exception as e:
-            print(f"Cache delete error: {e}")
+            print(f"Cache set_many error: {e}")
             return False
 
     @staticmethod
-    async def keys(pattern: str) -> List[str]:
-        """Get all keys matching pattern
-        
+    async def delete_many(keys: List[str]) -> bool:
+        """Delete several values from cache in one round trip
+
+        Args:
+            keys: Cache keys to delete
+
+        Returns:
+            bool: True if successful, False if error occurred
+        """
+        try:
+            if not keys:
+                return True
+
+            async with CacheService._client().pipeline(transaction=False) as pipe:
+                CacheService._untrack_video_keys(pipe, keys)
+                pipe.delete(*[CacheService._make_key(key) for key in keys])
+                CacheService._publish_invalidation(pipe, keys)
+                await pipe.execute()
+
+            return True
+
+        except Exception as e:
+            print(f"Cache delete_many error: {e}")
+            return False
+
+    @staticmethod
+    async def set_array(
+        key: str,
+        array: NDArray[Any],
+        timeout: int = 86400
+    ) -> bool:
+        """Store a NumPy array as raw bytes
+
+        Args:
+            key: Cache key to store array under
+            array: Array to store, kept in its own dtype
+            timeout: Cache timeout in seconds (default 24 hours)
+
+        Returns:
+            bool: True if successful, False if error occurred
+        """
+        try:
+            # .npy format: small dtype/shape header followed by the raw buffer
+            buffer = io.BytesIO()
+            np.save(buffer, np.ascontiguousarray(array), allow_pickle=False)
+
+            async with CacheService._client().pipeline(transaction=False) as pipe:
+                pipe.set(CacheService._make_key(key), CacheService._encode(buffer.getvalue()), ex=timeout)
+                CacheService._publish_invalidation(pipe, [key])
+                await pipe.execute()
+
+            return True
+
+        except Exception as e:
+            print(f"Cache set_array error: {e}")
+            return False
+
+    @staticmethod
+    async def get_array(key: str) -> Optional[NDArray[Any]]:
+        """Get a NumPy array stored with set_array
+
+        Args:
+            key: Cache key to retrieve
+
+        Returns:
+            Optional[NDArray]: Stored array or None if not found/error
+        """
+        try:
+            l1 = CacheService._l1(key)
+            if l1 is not None:
+                array = l1.get(key)
+                if array is not None:
+                    return array
+
+            generation = CacheService._l1_generation
+            value = CacheService._decode(
+                await CacheService._client().get(CacheService._make_key(key))
+            )
+            if not isinstance(value, bytes):
+                return None
+
+            array = np.load(io.BytesIO(value), allow_pickle=False)
+            # shared with later callers through the in-process cache
+            array.setflags(write=False)
+
+            CacheService._l1_fill(key, array, array.nbytes, generation)
+            return array
+
+        except Exception as e:
+            print(f"Cache get_array error: {e}")
+            return None
+
+    @staticmethod
+    async def delete(key: str) -> bool:
+        """Delete a value from cache
+
+        Args:
+            key: Cache key to delete
+
+        Returns:
+            bool: True if successful, False if error occurred
+        """
+        return await CacheService.delete_many([key])
+
+    @staticmethod
+    async def keys(
+        pattern: str,
+        offset: int = 0,
+        count: Optional[int] = None
+    ) -> List[str]:
+        """Get keys matching pattern, newest first
+
         Args:
             pattern: Pattern to match keys against (currently only supports 'video_*')
-            
+            offset: Number of keys to skip, for paging
+            count: Maximum number of keys to return (default all)
+
         Returns:
-            List[str]: List of matching cache keys
+            List[str]: List of matching cache keys ordered by created_at descending
         """
         try:
             if pattern == 'video_*':
-                all_keys = cache.get('all_video_keys', set())
-                return list(all_keys)
+                await CacheService._migrate_legacy_video_keys()
+
+                end = -1 if count is None else offset + count - 1
+                if count is not None and count <= 0:
+                    return []
+
+                keys = await CacheService._client().zrevrange(
+                    CacheService._make_key(CacheService.VIDEO_KEYS_INDEX), offset, end
+                )
+                return [key.decode() for key in keys]
 
             return []
 
         except Exception as e:
             print(f"Cache keys error: {e}")
-            return []
\ No newline at end of file
+            return []
+
+    @staticmethod
+    def _track_video_keys(pipe: Any, values: Dict[str, Any]) -> None:
+        """Queue adding video_* keys to the sorted key index
+
+        Args:
+            pipe: Pipeline the write is being sent on
+            values: Keys mapped to the values being stored under them
+
+        Note:
+            ZADD NX is atomic on the server, so concurrent writers cannot lose
+            each other's keys, and an existing key keeps its original score.
+        """
+        scores = {
+            key: CacheService._created_at_score(value)
+            for key, value in values.items() if key.startswith('video_')
+        }
+
+        if scores:
+            pipe.zadd(CacheService._make_key(CacheService.VIDEO_KEYS_INDEX), scores, nx=True)
+
+    @staticmethod
+    def _untrack_video_keys(pipe: Any, keys: List[str]) -> None:
+        """Queue removing video_* keys from the sorted key index"""
+        video_keys = [key for key in keys if key.startswith('video_')]
+
+        if video_keys:
+            pipe.zrem(CacheService._make_key(CacheService.VIDEO_KEYS_INDEX), *video_keys)
+
+    @staticmethod
+    def _created_at_score(value: Any) -> float:
+        """Score a video record by its created_at, falling back to now"""
+        value = CacheService._parse_json(value)
+
+        try:
+            created_at = datetime.fromisoformat(value['created_at'])
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            return created_at.timestamp()
+        except Exception:
+            return time.time()
+
+    @staticmethod
+    async def _migrate_legacy_video_keys() -> None:
+        """Move keys from the old pickled all_video_keys set into the index, once per process"""
+        if CacheService._legacy_keys_migrated:
+            return
+
+        client = CacheService._client()
+        legacy_key = CacheService._make_key('all_video_keys')
+
+        legacy_keys: Set[str] = CacheService._decode(await client.get(legacy_key))
+        if legacy_keys:
+            # legacy keys have no known created_at, score them as oldest
+            async with client.pipeline(transaction=False) as pipe:
+                pipe.zadd(
+                    CacheService._make_key(CacheService.VIDEO_KEYS_INDEX),
+                    {key: 0 for key in legacy_keys},
+                    nx=True
+                )
+                pipe.delete(legacy_key)
+                await pipe.execute()
+
+        CacheService._legacy_keys_migrated = True
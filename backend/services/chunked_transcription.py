@@ -0,0 +1,299 @@
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from django.conf import settings
+import asyncio
+import multiprocessing
+import threading
+import numpy as np
+from numpy.typing import NDArray
+from .audio_extractor import AudioExtractor
+
+# (first sample loaded, first sample owned, end sample) of one window
+Window = Tuple[int, int, int]
+
+# Whisper's mel frames are 10 ms, segment 'seek' is counted in them
+SAMPLES_PER_SEEK: int = 160
+
+# length of the frames compared when looking for silence
+VAD_FRAME_SECONDS: float = 0.03
+
+# model loaded once per pool worker, on its first window
+_worker_model: Any = None
+
+
+def _init_worker(threads: int) -> None:
+    import torch
+
+    # workers share the cores, keep each one from claiming all of them
+    torch.set_num_threads(threads)
+
+
+def _transcribe_window(
+    model_name: str,
+    audio_path: str,
+    offset: int,
+    count: int,
+    options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Transcribe one window of cached audio, runs in a pool worker"""
+    global _worker_model
+
+    if _worker_model is None:
+        import whisper
+        _worker_model = whisper.load_model(model_name)
+
+    # the worker maps only its own slice of the audio file
+    audio = AudioExtractor.load(audio_path, offset, count)
+    result = _worker_model.transcribe(audio, **options)
+
+    return {
+        'text': result['text'],
+        'segments': result['segments'],
+        'language': result.get('language')
+    }
+
+
+class ChunkedTranscriber:
+    """Transcribe long audio as parallel windows on a process pool
+
+    The audio is cut near every ``window`` seconds at the quietest point
+    within ``search`` seconds, so cuts fall in pauses rather than words.
+    Each window also re-reads ``overlap`` seconds before its cut to give
+    Whisper context. Segments are shifted to absolute times, and those
+    whose midpoint lies in the overlap, already covered by the previous
+    window, are dropped along with repeated text at the seams.
+
+    Pool workers are spawned processes that load the Whisper model on
+    their first window and keep it.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        max_workers: int,
+        window: float,
+        overlap: float,
+        search: float
+    ):
+        self.model_name: str = model_name
+        self.max_workers: int = max_workers
+        self.window: float = window
+        self.overlap: float = overlap
+        self.search: float = search
+
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                threads = max(1, (multiprocessing.cpu_count() or 1) // self.max_workers)
+
+                # forking a process that already runs torch threads is unsafe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker,
+                    initargs=(threads,)
+                )
+
+            return self._pool
+
+    def should_chunk(self, audio_path: str) -> bool:
+        """Check whether audio is long enough to be worth splitting
+
+        Args:
+            audio_path: Path to the PCM audio file
+
+        Returns:
+            True if the audio spans more than one window
+        """
+        return AudioExtractor.duration(audio_path) > self.window + self.search
+
+    async def transcribe(self, audio_path: str, **options: Any) -> Dict[str, Any]:
+        """Transcribe cached audio window by window in parallel
+
+        Args:
+            audio_path: Path to the PCM audio file written by AudioExtractor
+            **options: Passed to Whisper's transcribe
+
+        Returns:
+            Whisper-style result with text, segments and language
+        """
+        windows = await asyncio.to_thread(self.plan_windows, audio_path)
+        results = await asyncio.gather(*self.submit(audio_path, windows, **options))
+
+        return stitch(windows, results)
+
+    def plan_windows(self, audio_path: str) -> List[Window]:
+        """Split audio into silence-aligned windows with this transcriber's sizes
+
+        Args:
+            audio_path: Path to the PCM audio file
+
+        Returns:
+            Windows as (first sample loaded, first sample owned, end sample)
+        """
+        return plan_windows(audio_path, self.window, self.overlap, self.search)
+
+    def submit(self, audio_path: str, windows: List[Window], **options: Any) -> List[asyncio.Future]:
+        """Queue windows on the process pool
+
+        Args:
+            audio_path: Path to the PCM audio file written by AudioExtractor
+            windows: Windows as returned by plan_windows
+            **options: Passed to Whisper's transcribe
+
+        Returns:
+            One future per window resolving to its Whisper result, in
+            window order
+        """
+        pool = self._get_pool()
+
+        return [
+            asyncio.wrap_future(pool.submit(
+                _transcribe_window,
+                self.model_name,
+                audio_path,
+                load_start,
+                end - load_start,
+                options
+            ))
+            for load_start, _, end in windows
+        ]
+
+
+def plan_windows(audio_path: str, window: float, overlap: float, search: float) -> List[Window]:
+    """Split audio into silence-aligned windows
+
+    Args:
+        audio_path: Path to the PCM audio file
+        window: Target window length in seconds
+        overlap: Seconds re-read before each cut
+        search: How far from each target boundary to look for a pause
+
+    Returns:
+        Windows as (first sample loaded, first sample owned, end sample)
+
+    Raises:
+        ValueError: Unless 0 <= search < window
+    """
+    if not 0 <= search < window:
+        raise ValueError('Transcription split search must be shorter than the window')
+
+    samples = np.memmap(audio_path, dtype='<i2', mode='r')
+    sample_rate = AudioExtractor.SAMPLE_RATE
+
+    frame = int(VAD_FRAME_SECONDS * sample_rate)
+    energy = _frame_energy(samples, frame)
+
+    window_frames = max(int(window * sample_rate) // frame, 1)
+    # rounded to frames, every cut must still land after the previous one
+    search_frames = min(int(search * sample_rate) // frame, window_frames - 1)
+
+    cuts = [0]
+    while cuts[-1] + window_frames + search_frames < len(energy):
+        target = cuts[-1] + window_frames
+        lo, hi = target - search_frames, target + search_frames + 1
+        cuts.append(lo + int(np.argmin(energy[lo:hi])))
+
+    overlap_samples = int(overlap * sample_rate)
+    boundaries = [cut * frame for cut in cuts] + [len(samples)]
+
+    return [
+        (max(start - overlap_samples, 0), start, end)
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
+
+
+def _frame_energy(samples: NDArray[np.int16], frame: int) -> NDArray[np.float64]:
+    frames = len(samples) // frame
+    if frames == 0:
+        return np.zeros(0)
+
+    framed = samples[:frames * frame].reshape(frames, frame)
+    return np.einsum('ij,ij->i', framed, framed, dtype=np.float64)
+
+
+def stitch(windows: List[Window], results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge per-window results into one transcript
+
+    Args:
+        windows: Windows as returned by plan_windows
+        results: Whisper result for each window, in the same order; may
+            cover only the first windows, earlier segments never change
+            as later results are added
+
+    Returns:
+        Whisper-style result with absolute segment times
+    """
+    sample_rate = AudioExtractor.SAMPLE_RATE
+    segments: List[Dict[str, Any]] = []
+
+    for (load_start, own_start, _), result in zip(windows, results):
+        offset = load_start / sample_rate
+        own_from = own_start / sample_rate
+        # only the first segment kept after a cut can repeat the previous window
+        at_seam = bool(segments)
+
+        for segment in result['segments']:
+            start, end = segment['start'] + offset, segment['end'] + offset
+
+            # the overlap was transcribed by the previous window already
+            if (start + end) / 2 < own_from:
+                continue
+
+            # a sentence straddling the cut can come out of both windows
+            if at_seam:
+                at_seam = False
+                previous = segments[-1]
+                if start < previous['end'] and (
+                    segment['text'].strip().lower() == previous['text'].strip().lower()
+                ):
+                    continue
+
+            segments.append({
+                **segment,
+                'id': len(segments),
+                'seek': segment.get('seek', 0) + load_start // SAMPLES_PER_SEEK,
+                'start': start,
+                'end': end
+            })
+
+    return {
+        'text': ''.join(segment['text'] for segment in segments),
+        'segments': segments,
+        'language': results[0].get('language') if results else None
+    }
+
+
+_chunked_transcriber: Optional[ChunkedTranscriber] = None
+_chunked_transcriber_lock = threading.Lock()
+
+
+def get_chunked_transcriber(model_name: str) -> Optional[ChunkedTranscriber]:
+    """Get the process-wide chunked transcriber
+
+    Args:
+        model_name: Whisper model the pool workers load
+
+    Returns:
+        The shared ChunkedTranscriber, or None if CHUNKED_TRANSCRIPTION_ENABLED
+        is off
+    """
+    global _chunked_transcriber
+
+    if not settings.CHUNKED_TRANSCRIPTION_ENABLED:
+        return None
+
+    with _chunked_transcriber_lock:
+        if _chunked_transcriber is None:
+            _chunked_transcriber = ChunkedTranscriber(
+                model_name,
+                max_workers=settings.TRANSCRIPTION_WORKERS,
+                window=settings.TRANSCRIPTION_WINDOW_SECONDS,
+                overlap=settings.TRANSCRIPTION_OVERLAP_SECONDS,
+                search=settings.TRANSCRIPTION_SPLIT_SEARCH_SECONDS
+            )
+
+        return _chunked_transcriber
@@ -0,0 +1,83 @@
+from typing import Callable, Dict, List, Set, Tuple
+import asyncio
+import numpy as np
+from numpy.typing import NDArray
+from .inference_executor import InferenceExecutor
+
+PendingBatch = List[Tuple[str, asyncio.Future]]
+
+
+class EmbeddingBatcher:
+    """Coalesce concurrent single-text encodes into batched forward passes
+
+    The first caller opens a batch and schedules it to flush after
+    ``max_wait`` seconds; callers arriving in that window join it. A batch
+    is flushed early once it reaches ``max_batch_size``. Each batch is
+    encoded with one call on the inference executor and every caller's
+    future is resolved with its own row.
+
+    Batches are kept per event loop since asyncio futures cannot be shared
+    between loops.
+    """
+
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], NDArray[np.float32]],
+        executor: InferenceExecutor,
+        max_batch_size: int,
+        max_wait: float
+    ):
+        self.encode_batch = encode_batch
+        self.executor: InferenceExecutor = executor
+        self.max_batch_size: int = max_batch_size
+        self.max_wait: float = max_wait
+
+        self._pending: Dict[asyncio.AbstractEventLoop, PendingBatch] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def encode(self, text: str) -> NDArray[np.float32]:
+        """Encode one text as part of the next batch
+
+        Args:
+            text: Text to encode
+
+        Returns:
+            The text's embedding row
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._pending.get(loop)
+        if batch is None:
+            batch = self._pending[loop] = []
+            loop.call_later(self.max_wait, self._flush, loop, batch)
+
+        batch.append((text, future))
+        if len(batch) >= self.max_batch_size:
+            self._flush(loop, batch)
+
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, batch: PendingBatch) -> None:
+        # the timer still fires for batches already flushed because they filled up
+        if self._pending.get(loop) is not batch:
+            return
+
+        del self._pending[loop]
+
+        task = loop.create_task(self._encode(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _encode(self, batch: PendingBatch) -> None:
+        try:
+            embeddings = await self.executor.run(self.encode_batch, [text for text, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), embedding in zip(batch, embeddings):
+            if not future.done():
+                future.set_result(embedding)
@@ -0,0 +1,127 @@
+from typing import Any, Callable, Optional, TypeVar
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+import asyncio
+import functools
+import threading
+import time
+
+T = TypeVar('T')
+
+
+class InferenceQueueFull(Exception):
+    """Raised when a model call waited too long for an inference slot"""
+
+
+class InferenceExecutor:
+    """Bounded executor for blocking model inference
+
+    Model calls run on a dedicated thread pool so they never block the event
+    loop shared by HTTP views and websocket consumers. Torch, spaCy and NumPy
+    release the GIL while they compute, so threads give real parallelism
+    without loading a copy of every model per worker.
+
+    At most ``max_workers + max_queue`` calls are in flight. Further callers
+    wait asynchronously for a slot and give up with InferenceQueueFull after
+    ``queue_timeout`` seconds, which keeps a burst of requests from piling
+    up unbounded work behind the models.
+
+    Queries and ingest (transcription and segment embedding) each get their
+    own executor, see get_inference_executor and get_ingest_executor, so a
+    minutes-long Whisper run never sits in front of a query encode.
+    """
+
+    POLL_INTERVAL: float = 0.01
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue: int,
+        queue_timeout: float,
+        name: str = 'inference'
+    ):
+        self.max_workers: int = max_workers
+        self.max_queue: int = max_queue
+        self.queue_timeout: float = queue_timeout
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=name
+        )
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking callable on the inference pool
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            The callable's return value
+
+        Raises:
+            InferenceQueueFull: If no slot became free within queue_timeout
+        """
+        await self._acquire_slot()
+
+        try:
+            future = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        except Exception:
+            self._slots.release()
+            raise
+
+        # release on completion, not on await, so cancelled callers keep the slot until the work ends
+        future.add_done_callback(lambda _: self._slots.release())
+
+        return await asyncio.wrap_future(future)
+
+    async def _acquire_slot(self) -> None:
+        # the semaphore is shared by every event loop in the process, so poll rather than block
+        deadline = time.monotonic() + self.queue_timeout
+
+        while not self._slots.acquire(blocking=False):
+            if time.monotonic() >= deadline:
+                raise InferenceQueueFull('Model inference is overloaded, try again later')
+
+            await asyncio.sleep(self.POLL_INTERVAL)
+
+
+_inference_executor: Optional[InferenceExecutor] = None
+_inference_executor_lock = threading.Lock()
+
+
+def get_inference_executor() -> InferenceExecutor:
+    """Get the process-wide executor for query-time model calls, creating it on first use"""
+    global _inference_executor
+
+    with _inference_executor_lock:
+        if _inference_executor is None:
+            _inference_executor = InferenceExecutor(
+                max_workers=settings.INFERENCE_WORKERS,
+                max_queue=settings.INFERENCE_MAX_QUEUE,
+                queue_timeout=settings.INFERENCE_QUEUE_TIMEOUT
+            )
+
+        return _inference_executor
+
+
+_ingest_executor: Optional[InferenceExecutor] = None
+_ingest_executor_lock = threading.Lock()
+
+
+def get_ingest_executor() -> InferenceExecutor:
+    """Get the process-wide executor for transcription and segment embedding, creating it on first use"""
+    global _ingest_executor
+
+    with _ingest_executor_lock:
+        if _ingest_executor is None:
+            _ingest_executor = InferenceExecutor(
+                max_workers=settings.INGEST_INFERENCE_WORKERS,
+                max_queue=settings.INGEST_INFERENCE_MAX_QUEUE,
+                queue_timeout=settings.INGEST_INFERENCE_QUEUE_TIMEOUT,
+                name='ingest'
+            )
+
+        return _ingest_executor
@@ -0,0 +1,121 @@
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+from collections import OrderedDict
+import threading
+import time
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+class LRUCache(Generic[K, V]):
+    """Thread-safe in-process LRU cache with optional per-entry TTL
+
+    Holds at most ``max_size`` entries, and at most ``max_bytes`` bytes
+    when given, evicting the least recently used entries first. Entry
+    sizes come from ``sizeof`` or are passed to ``set``. Entries older
+    than ``ttl`` seconds are treated as missing. Values are returned as
+    stored, so callers must not mutate them.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[V], int]] = None
+    ):
+        self.max_size: int = max_size
+        self.ttl: Optional[float] = ttl
+        self.max_bytes: Optional[int] = max_bytes
+        self.sizeof: Optional[Callable[[V], int]] = sizeof
+
+        self._entries: 'OrderedDict[K, Tuple[float, V, int]]' = OrderedDict()
+        self._bytes: int = 0
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a value, marking it as most recently used
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[V]: Cached value or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or (self.ttl is not None and time.monotonic() - entry[0] > self.ttl):
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: K, value: V, size: Optional[int] = None) -> None:
+        """Store a value, evicting least recently used entries when full
+
+        Args:
+            key: Cache key
+            value: Value to store
+            size: Size in bytes counted against max_bytes, computed with
+                sizeof when omitted
+        """
+        if size is None:
+            size = self.sizeof(value) if self.sizeof else 0
+
+        with self._lock:
+            self._remove(key)
+
+            # values that could never fit would only flush everything else
+            if self.max_size <= 0 or (self.max_bytes is not None and size > self.max_bytes):
+                return
+
+            self._entries[key] = (time.monotonic(), value, size)
+            self._bytes += size
+
+            while len(self._entries) > self.max_size or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key: K) -> None:
+        """Remove a value if present
+
+        Args:
+            key: Cache key
+        """
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: K) -> None:
+        # callers hold the lock
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def stats(self) -> Dict[str, int]:
+        """Get hit/miss counters and current size
+
+        Returns:
+            Dict with hits, misses, size, max_size and bytes
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'bytes': self._bytes
+            }
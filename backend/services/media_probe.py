@@ -0,0 +1,178 @@
+from typing import Any, Dict, List, Optional, TypedDict
+from fractions import Fraction
+from django.conf import settings
+import json
+import subprocess
+import cv2
+
+
+class MediaInfo(TypedDict):
+    """Type definition for probed media information"""
+    duration: float
+    width: int
+    height: int
+    codec: Optional[str]
+    frame_count: int
+    fps: float
+    has_audio: bool
+    keyframes: List[float]
+
+
+class MediaProbeError(Exception):
+    """Raised when a file cannot be read as a video"""
+
+
+class MediaTooLong(MediaProbeError):
+    """Raised when a video is longer than the allowed duration"""
+
+
+class MediaProbe:
+    """Read a video's container metadata once, without decoding it
+
+    Uses ffprobe (FFPROBE_BINARY) when available: one call for the format
+    and streams, then, only for files within the duration limit, a packet
+    scan for keyframe timestamps. Neither decodes any frames. Without
+    ffprobe, OpenCV's container properties are used and keyframes are left
+    unknown.
+    """
+
+    @staticmethod
+    def probe(file_path: str, max_duration: Optional[float] = None) -> MediaInfo:
+        """Probe a video file
+
+        Args:
+            file_path: Path to the video file
+            max_duration: Longest allowed duration in seconds, if any
+
+        Returns:
+            Duration, dimensions, codec, frame count, frame rate, whether
+            there is an audio stream, and keyframe timestamps in seconds
+
+        Raises:
+            MediaTooLong: If the video is longer than max_duration, raised
+                before the keyframe scan
+            MediaProbeError: If the file has no readable video stream
+        """
+        try:
+            info = MediaProbe._probe_streams(file_path)
+            use_ffprobe = True
+        except FileNotFoundError:
+            # ffprobe is not installed
+            info = MediaProbe._probe_opencv(file_path)
+            use_ffprobe = False
+
+        if max_duration is not None and info['duration'] > max_duration:
+            raise MediaTooLong(f"Video is {info['duration']:.0f}s, the limit is {max_duration:.0f}s")
+
+        if use_ffprobe:
+            info['keyframes'] = MediaProbe._probe_keyframes(file_path)
+
+        return info
+
+    @staticmethod
+    def _run_ffprobe(file_path: str, *args: str) -> Dict[str, Any]:
+        result = subprocess.run(
+            [settings.FFPROBE_BINARY, '-v', 'error', '-print_format', 'json', *args, file_path],
+            capture_output=True,
+            timeout=settings.FFPROBE_TIMEOUT,
+            check=False
+        )
+
+        if result.returncode != 0:
+            raise MediaProbeError(f"ffprobe failed: {result.stderr.decode(errors='replace').strip()}")
+
+        return json.loads(result.stdout or b'{}')
+
+    @staticmethod
+    def _probe_streams(file_path: str) -> MediaInfo:
+        data = MediaProbe._run_ffprobe(file_path, '-show_format', '-show_streams')
+        streams = data.get('streams', [])
+
+        video = next((s for s in streams if s.get('codec_type') == 'video'), None)
+        if video is None:
+            raise MediaProbeError('No video stream found')
+
+        duration = float(data.get('format', {}).get('duration') or video.get('duration') or 0)
+
+        try:
+            fps = float(Fraction(video.get('avg_frame_rate') or video.get('r_frame_rate') or '0/1'))
+        except (ValueError, ZeroDivisionError):
+            fps = 0.0
+
+        # nb_frames is missing from some containers, estimate it from the rate
+        frame_count = int(video.get('nb_frames') or round(duration * fps))
+
+        return {
+            'duration': duration,
+            'width': int(video.get('width') or 0),
+            'height': int(video.get('height') or 0),
+            'codec': video.get('codec_name'),
+            'frame_count': frame_count,
+            'fps': fps,
+            'has_audio': any(s.get('codec_type') == 'audio' for s in streams),
+            'keyframes': []
+        }
+
+    @staticmethod
+    def _probe_keyframes(file_path: str) -> List[float]:
+        # packet flags come from the container index, no frame is decoded
+        data = MediaProbe._run_ffprobe(
+            file_path,
+            '-select_streams', 'v:0',
+            '-show_entries', 'packet=pts_time,flags'
+        )
+
+        keyframes = []
+        for packet in data.get('packets', []):
+            if 'K' in packet.get('flags', '') and packet.get('pts_time', 'N/A') != 'N/A':
+                keyframes.append(float(packet['pts_time']))
+
+        return sorted(keyframes)
+
+    @staticmethod
+    def _probe_opencv(file_path: str) -> MediaInfo:
+        cap = cv2.VideoCapture(file_path)
+        try:
+            if not cap.isOpened():
+                raise MediaProbeError('Could not open video file')
+
+            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+            fps = cap.get(cv2.CAP_PROP_FPS) or 0.0
+
+            fourcc = int(cap.get(cv2.CAP_PROP_FOURCC))
+            codec = ''.join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4)).strip() or None
+
+            return {
+                'duration': frame_count / fps if fps else 0.0,
+                'width': int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+                'height': int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+                'codec': codec,
+                'frame_count': frame_count,
+                'fps': fps,
+                # OpenCV does not report audio streams, assume one is there
+                'has_audio': True,
+                'keyframes': []
+            }
+        finally:
+            cap.release()
+
+    @staticmethod
+    def thumbnail_time(info: MediaInfo) -> float:
+        """Pick the timestamp to grab a thumbnail from
+
+        Args:
+            info: Result of probe
+
+        Returns:
+            The keyframe nearest the middle of the video, or the middle
+            itself when keyframes are unknown
+
+        Note:
+            Seeking to a keyframe lets the decoder start right there instead
+            of decoding forward from the previous one.
+        """
+        middle = info['duration'] / 2
+        if not info['keyframes']:
+            return middle
+
+        return min(info['keyframes'], key=lambda keyframe: abs(keyframe - middle))
@@ -0,0 +1,159 @@
+from typing import Any, Callable, Dict, List, Optional
+from django.conf import settings
+import threading
+import time
+import numpy as np
+from numpy.typing import NDArray
+from .audio_extractor import AudioExtractor
+from .model_server import ModelServerClient
+
+
+def _load_whisper() -> Any:
+    import whisper
+    return whisper.load_model(settings.WHISPER_MODEL)
+
+
+def _load_nlp() -> Any:
+    import spacy
+    return spacy.load(settings.SPACY_MODEL)
+
+
+def _load_semantic() -> Any:
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(settings.SEMANTIC_MODEL)
+
+
+class ModelRegistry:
+    """Load each model once, on first use, and share it across the process
+
+    Models are named in settings (WHISPER_MODEL, SPACY_MODEL and
+    SEMANTIC_MODEL). Each has its own lock, so a thread loading Whisper
+    never blocks one that only needs spaCy, and concurrent first users of
+    a model wait for a single load.
+
+    With a ModelServerClient, encode and transcribe run in the shared
+    model server process instead and neither model is loaded here. spaCy
+    is small and its documents do not cross processes, so it is always
+    loaded locally.
+    """
+
+    LOADERS: Dict[str, Callable[[], Any]] = {
+        'whisper': _load_whisper,
+        'nlp': _load_nlp,
+        'semantic': _load_semantic
+    }
+
+    def __init__(self, client: Optional[ModelServerClient] = None):
+        self.client: Optional[ModelServerClient] = client
+
+        self._models: Dict[str, Any] = {}
+        self._locks: Dict[str, threading.Lock] = {name: threading.Lock() for name in self.LOADERS}
+
+    def get(self, name: str) -> Any:
+        """Get a model, loading it if this is its first use
+
+        Args:
+            name: One of LOADERS
+
+        Returns:
+            The loaded model
+        """
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._locks[name]:
+            if name not in self._models:
+                started = time.monotonic()
+                self._models[name] = self.LOADERS[name]()
+                print(f"Loaded {name} model in {time.monotonic() - started:.1f}s")
+
+            return self._models[name]
+
+    def preload(self, names: Optional[List[str]] = None) -> None:
+        """Load models ahead of their first use
+
+        Args:
+            names: Models to load (default: all of them)
+        """
+        for name in names or self.LOADERS:
+            self.get(name)
+
+    def loaded(self) -> List[str]:
+        """Get the names of the models loaded in this process"""
+        return list(self._models)
+
+    @property
+    def nlp(self) -> Any:
+        """The spaCy pipeline"""
+        return self.get('nlp')
+
+    def encode(self, texts: List[str], batch_size: int) -> NDArray[np.float32]:
+        """Embed texts with the sentence embedding model
+
+        Args:
+            texts: Texts to embed
+            batch_size: Texts per forward pass
+
+        Returns:
+            float32 matrix with one (unnormalized) row per text
+        """
+        if self.client:
+            return self.client.call('encode', texts, batch_size)
+
+        return self.get('semantic').encode(texts, batch_size=batch_size)
+
+    def transcribe(
+        self,
+        audio_path: str,
+        offset: int = 0,
+        count: Optional[int] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """Run Whisper over cached audio
+
+        Args:
+            audio_path: 16 kHz mono PCM file written by AudioExtractor
+            offset: First sample to transcribe
+            count: Number of samples to transcribe (default to the end)
+            **options: Passed to Whisper's transcribe
+
+        Returns:
+            Whisper result with text, segments and language
+
+        Note:
+            Only the path is sent to the model server, which reads the
+            audio from the same disk.
+        """
+        if self.client:
+            return self.client.call('transcribe', audio_path, offset, count, **options)
+
+        return self.get('whisper').transcribe(AudioExtractor.load(audio_path, offset, count), **options)
+
+
+_model_registry: Optional[ModelRegistry] = None
+_model_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Get the process-wide model registry, creating it on first use
+
+    Returns:
+        Registry backed by the model server at MODEL_SERVER_SOCKET when it
+        is set, otherwise one that loads models in this process
+    """
+    global _model_registry
+
+    with _model_registry_lock:
+        if _model_registry is None:
+            client = None
+            if settings.MODEL_SERVER_SOCKET:
+                client = ModelServerClient(
+                    settings.MODEL_SERVER_SOCKET,
+                    authkey=settings.MODEL_SERVER_AUTHKEY.encode(),
+                    timeout=settings.MODEL_SERVER_TIMEOUT
+                )
+
+            _model_registry = ModelRegistry(client)
+
+        return _model_registry
@@ -0,0 +1,157 @@
+from typing import Any, Dict, Tuple
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+import os
+import threading
+
+# (status, result) sent back for each (method, args, kwargs) request
+Reply = Tuple[str, Any]
+
+
+class ModelServerError(Exception):
+    """Raised when the model server cannot be reached or a call on it fails"""
+
+
+def _require_authkey(authkey: bytes) -> None:
+    # without a key multiprocessing skips the handshake, and replies are unpickled
+    if not authkey:
+        raise ModelServerError('MODEL_SERVER_AUTHKEY (or SECRET_KEY) must be set to use the model server')
+
+
+class ModelServerClient:
+    """Send model calls to a ModelServer over its Unix socket
+
+    Each thread keeps its own connection, opened on its first call, so
+    inference executor workers never share one. A connection that fails
+    or times out is closed and reopened on the next call.
+
+    Raises:
+        ModelServerError: If authkey is empty
+    """
+
+    def __init__(self, address: str, authkey: bytes, timeout: float):
+        _require_authkey(authkey)
+
+        self.address: str = address
+        self.authkey: bytes = authkey
+        self.timeout: float = timeout
+
+        self._local = threading.local()
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """Run a model method on the server
+
+        Args:
+            method: Name of the model method, one of ModelServer.METHODS
+            *args: Positional arguments, must be picklable
+            **kwargs: Keyword arguments, must be picklable
+
+        Returns:
+            The method's result
+
+        Raises:
+            ModelServerError: If the server is unreachable, times out or
+                the call raises there
+        """
+        try:
+            connection = self._connection()
+            connection.send((method, args, kwargs))
+
+            if not connection.poll(self.timeout):
+                self._disconnect()
+                raise ModelServerError(f'Model server did not answer {method} within {self.timeout:.0f}s')
+
+            status, result = connection.recv()
+        except (OSError, EOFError, AuthenticationError) as e:
+            self._disconnect()
+            raise ModelServerError(f'Model server connection failed: {e}') from e
+
+        if status != 'ok':
+            raise ModelServerError(result)
+
+        return result
+
+    def _connection(self) -> Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = Client(self.address, family='AF_UNIX', authkey=self.authkey)
+
+        return connection
+
+    def _disconnect(self) -> None:
+        connection = getattr(self._local, 'connection', None)
+        self._local.connection = None
+
+        if connection is not None:
+            connection.close()
+
+
+class ModelServer:
+    """Serve a process's models to other processes over a Unix socket
+
+    ``backend`` is normally a ModelRegistry loading its models in this
+    process. Every accepted connection is handled on its own thread. Each
+    method has its own limit on concurrent calls in ``concurrency``, so
+    long transcriptions never hold up encodes; calls over the limit wait
+    their turn. Only the methods in METHODS can be called.
+
+    Raises:
+        ModelServerError: If authkey is empty
+    """
+
+    METHODS: Tuple[str, ...] = ('encode', 'transcribe')
+
+    def __init__(self, backend: Any, address: str, authkey: bytes, concurrency: Dict[str, int]):
+        _require_authkey(authkey)
+
+        self.backend: Any = backend
+        self.address: str = address
+        self.authkey: bytes = authkey
+
+        self._slots: Dict[str, threading.BoundedSemaphore] = {
+            method: threading.BoundedSemaphore(concurrency[method]) for method in self.METHODS
+        }
+
+    def serve_forever(self) -> None:
+        """Accept connections until the process is stopped"""
+        # a socket left behind by a previous run would make bind fail
+        if os.path.exists(self.address):
+            os.remove(self.address)
+
+        # the socket is created owner-only, never briefly open to other users
+        umask = os.umask(0o177)
+        try:
+            listener = Listener(self.address, family='AF_UNIX', authkey=self.authkey)
+        finally:
+            os.umask(umask)
+
+        with listener:
+            while True:
+                try:
+                    connection = listener.accept()
+                except Exception as e:
+                    print(f"Model server accept error: {e}")
+                    continue
+
+                threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+
+    def _serve_connection(self, connection: Connection) -> None:
+        with connection:
+            while True:
+                try:
+                    method, args, kwargs = connection.recv()
+                    connection.send(self._dispatch(method, args, kwargs))
+                except (EOFError, OSError):
+                    # the client went away
+                    return
+
+    def _dispatch(self, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Reply:
+        if method not in self.METHODS:
+            return 'error', f'Unknown model server method: {method}'
+
+        try:
+            with self._slots[method]:
+                return 'ok', getattr(self.backend, method)(*args, **kwargs)
+        except Exception as e:
+            print(f"Model server {method} error: {e}")
+            return 'error', str(e)
@@ -0,0 +1,145 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+import asyncio
+import threading
+from .cache_service import CacheService
+
+JobResult = Dict[str, Any]
+
+
+class ProcessingQueueFull(Exception):
+    """Raised when the processing queue has no room for another job"""
+
+
+class ProcessingQueue:
+    """Bounded background job runner for video processing
+
+    Jobs run on a dedicated thread pool, each inside its own event loop, so
+    transcription and thumbnailing never block the ASGI event loop. At most
+    ``max_workers`` jobs run at once and at most ``max_pending`` more wait
+    for a worker; anything beyond that is rejected with ProcessingQueueFull.
+
+    A job is a coroutine function returning a result dict with ``success``.
+    Unsuccessful results are retried with a linear backoff unless they carry
+    ``retryable: False``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        max_retries: int = 2,
+        retry_delay: float = 5.0
+    ):
+        self.max_workers: int = max_workers
+        self.max_pending: int = max_pending
+        self.max_retries: int = max_retries
+        self.retry_delay: float = retry_delay
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix='video-processing'
+        )
+        self._lock = threading.Lock()
+        self._active: int = 0
+
+    def submit(
+        self,
+        job: Callable[[], Awaitable[JobResult]],
+        on_failure: Optional[Callable[[JobResult], Awaitable[None]]] = None
+    ) -> None:
+        """Queue a job for background execution
+
+        Args:
+            job: Coroutine function performing the work
+            on_failure: Coroutine function called with the last result once
+                all attempts have failed
+
+        Raises:
+            ProcessingQueueFull: If the queue is at capacity
+        """
+        with self._lock:
+            if self._active >= self.max_workers + self.max_pending:
+                raise ProcessingQueueFull('Video processing queue is full, try again later')
+
+            self._active += 1
+
+        self._executor.submit(self._run_in_thread, job, on_failure)
+
+    @property
+    def active_jobs(self) -> int:
+        """Number of jobs currently running or waiting for a worker"""
+        return self._active
+
+    def _run_in_thread(
+        self,
+        job: Callable[[], Awaitable[JobResult]],
+        on_failure: Optional[Callable[[JobResult], Awaitable[None]]]
+    ) -> None:
+        try:
+            asyncio.run(self._run_with_retries(job, on_failure))
+        finally:
+            with self._lock:
+                self._active -= 1
+
+    async def _run_with_retries(
+        self,
+        job: Callable[[], Awaitable[JobResult]],
+        on_failure: Optional[Callable[[JobResult], Awaitable[None]]]
+    ) -> None:
+        try:
+            await self._run_attempts(job, on_failure)
+        finally:
+            # the job's event loop ends here, release its Redis connections with it
+            try:
+                await CacheService.close_client()
+            except Exception as e:
+                print(f"Processing job cache cleanup error: {str(e)}")
+
+    async def _run_attempts(
+        self,
+        job: Callable[[], Awaitable[JobResult]],
+        on_failure: Optional[Callable[[JobResult], Awaitable[None]]]
+    ) -> None:
+        result: JobResult = {'success': False, 'error': 'Job did not run'}
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                result = await job()
+            except Exception as e:
+                print(f"Processing job error: {str(e)}")
+                result = {'success': False, 'error': str(e)}
+
+            if result.get('success') or not result.get('retryable', True):
+                break
+
+            if attempt < self.max_retries:
+                print(f"Processing job failed, retrying ({attempt + 1}/{self.max_retries}): {result.get('error')}")
+                await asyncio.sleep(self.retry_delay * (attempt + 1))
+
+        if not result.get('success') and on_failure:
+            try:
+                await on_failure(result)
+            except Exception as e:
+                print(f"Processing failure handler error: {str(e)}")
+
+
+_processing_queue: Optional[ProcessingQueue] = None
+_processing_queue_lock = threading.Lock()
+
+
+def get_processing_queue() -> ProcessingQueue:
+    """Get the process-wide video processing queue, creating it on first use"""
+    global _processing_queue
+
+    with _processing_queue_lock:
+        if _processing_queue is None:
+            _processing_queue = ProcessingQueue(
+                max_workers=settings.VIDEO_PROCESSING_WORKERS,
+                max_pending=settings.VIDEO_PROCESSING_MAX_PENDING,
+                max_retries=settings.VIDEO_PROCESSING_MAX_RETRIES,
+                retry_delay=settings.VIDEO_PROCESSING_RETRY_DELAY
+            )
+
+        return _processing_queue
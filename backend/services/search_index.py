@@ -0,0 +1,434 @@
+from typing import Dict, Optional, List, TypedDict, Any, Sequence, Mapping, Tuple
+import os
+import threading
+import numpy as np
+from numpy.typing import NDArray
+from django.conf import settings
+
+class SegmentHit(TypedDict):
+    """Type definition for a library-wide search hit"""
+    video_id: str
+    timestamp: float
+    text: str
+    confidence: float
+
+class SearchIndex:
+    """Approximate nearest neighbour index over every transcript segment
+
+    Inverted-file (IVF) layout: once enough segments are indexed, each row
+    is listed under the nearest of a set of k-means centroids and a query
+    only reads and scores the lists of the centroids closest to it. Smaller
+    libraries are searched exhaustively.
+
+    Each video is persisted as its own shard file so updates are incremental,
+    and a manifest file is touched on every change so other worker processes
+    pick up additions, replacements and deletions on their next search.
+
+    Centroids are trained on a background thread from a snapshot of the
+    rows, so searches and updates keep running (exhaustively until the
+    first training finishes) while k-means iterates.
+    """
+
+    # exhaustive search below this many segments
+    TRAIN_THRESHOLD: int = 4096
+    KMEANS_ITERATIONS: int = 10
+    # k-means is trained on at most this many vectors per centroid
+    TRAINING_SAMPLES_PER_LIST: int = 64
+    MIN_CAPACITY: int = 1024
+    ASSIGN_CHUNK_SIZE: int = 65536
+
+    def __init__(self, index_dir: Optional[str] = None, nprobe: Optional[int] = None):
+        self.index_dir: str = index_dir or settings.SEARCH_INDEX_DIR
+        self.nprobe: int = nprobe or settings.SEARCH_INDEX_NPROBE
+        self.shard_dir: str = os.path.join(self.index_dir, 'videos')
+        self.manifest_path: str = os.path.join(self.index_dir, 'manifest')
+
+        self._lock = threading.RLock()
+        self._manifest_version: Optional[int] = None
+        # (inode, mtime, size) of each shard as last loaded or written
+        self._shard_versions: Dict[str, Tuple[int, int, int]] = {}
+
+        # row storage, grown geometrically; rows past _size are unused
+        self._vectors: NDArray[np.float32] = np.zeros((0, 0), dtype=np.float32)
+        self._starts: NDArray[np.float32] = np.zeros(0, dtype=np.float32)
+        self._alive: NDArray[np.bool_] = np.zeros(0, dtype=bool)
+        self._video_ids: List[str] = []
+        self._texts: List[str] = []
+        self._size: int = 0
+        self._live_count: int = 0
+        self._rows_by_video: Dict[str, NDArray[np.intp]] = {}
+
+        self._centroids: Optional[NDArray[np.float32]] = None
+        # row numbers under each centroid, as chunks merged on first probe;
+        # removed rows stay listed until compaction and are skipped by search
+        self._lists: List[List[NDArray[np.intp]]] = []
+        self._trained_size: int = 0
+        self._training: bool = False
+        # bumped whenever row numbers change, invalidating a training snapshot
+        self._layout_generation: int = 0
+
+    def add_video(
+        self,
+        video_id: str,
+        embeddings: Any,
+        segments: Sequence[Mapping[str, Any]]
+    ) -> None:
+        """Add or replace a video's segments in the index
+
+        Args:
+            video_id: ID of the video
+            embeddings: Normalized segment embedding matrix (one row per segment)
+            segments: Transcript segments matching the embedding rows
+        """
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        starts = np.asarray([segment['start'] for segment in segments], dtype=np.float32)
+        texts = [segment['text'] for segment in segments]
+
+        with self._lock:
+            self._sync()
+            self._shard_versions[video_id] = self._write_shard(video_id, vectors, starts, texts)
+            self._remove_rows(video_id)
+            self._append_rows(video_id, vectors, starts, texts)
+            self._touch_manifest()
+
+    def remove_video(self, video_id: str) -> None:
+        """Remove a video's segments from the index
+
+        Args:
+            video_id: ID of the video to remove
+        """
+        with self._lock:
+            self._sync()
+
+            shard_path = self._shard_path(video_id)
+            if os.path.exists(shard_path):
+                os.remove(shard_path)
+
+            self._shard_versions.pop(video_id, None)
+            self._remove_rows(video_id)
+            self._touch_manifest()
+
+    def search(self, query_embedding: NDArray[np.float32], limit: int = 10) -> List[SegmentHit]:
+        """Find the segments most similar to a query across all videos
+
+        Args:
+            query_embedding: Unit-length query embedding
+            limit: Maximum number of hits to return
+
+        Returns:
+            List of hits sorted by descending similarity
+        """
+        with self._lock:
+            self._sync()
+
+            query = np.asarray(query_embedding, dtype=np.float32)
+            if self._live_count == 0 or limit <= 0 or query.shape[0] != self._vectors.shape[1]:
+                return []
+
+            if self._centroids is None:
+                candidates = np.flatnonzero(self._alive[:self._size])
+            else:
+                nprobe = min(self.nprobe, len(self._centroids))
+                probes = np.argpartition(-(self._centroids @ query), nprobe - 1)[:nprobe]
+                candidates = np.concatenate([self._list_rows(list_id) for list_id in probes])
+                candidates = candidates[self._alive[candidates]]
+
+            scores = self._vectors[candidates] @ query
+            if len(candidates) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                candidates, scores = candidates[top], scores[top]
+
+            order = np.argsort(-scores, kind='stable')
+
+            return [{
+                'video_id': self._video_ids[candidates[index]],
+                'timestamp': float(self._starts[candidates[index]]),
+                'text': self._texts[candidates[index]],
+                'confidence': float(scores[index])
+            } for index in order]
+
+    def _list_rows(self, list_id: int) -> NDArray[np.intp]:
+        """Get the rows listed under a centroid, merging their chunks"""
+        chunks = self._lists[list_id]
+        if len(chunks) != 1:
+            chunks = self._lists[list_id] = [
+                np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.intp)
+            ]
+
+        return chunks[0]
+
+    @staticmethod
+    def _group_rows(rows: NDArray[np.intp], assignments: NDArray[np.int32]) -> Dict[int, NDArray[np.intp]]:
+        """Split rows by the centroid each is assigned to"""
+        order = np.argsort(assignments, kind='stable')
+        list_ids, firsts = np.unique(assignments[order], return_index=True)
+
+        return dict(zip(list_ids.tolist(), np.split(rows[order], firsts[1:])))
+
+    def _shard_path(self, video_id: str) -> str:
+        return os.path.join(self.shard_dir, f'{video_id}.npz')
+
+    def _write_shard(
+        self,
+        video_id: str,
+        vectors: NDArray[np.float32],
+        starts: NDArray[np.float32],
+        texts: List[str]
+    ) -> Tuple[int, int, int]:
+        """Persist one video's rows, replacing the shard atomically
+
+        Returns:
+            Version of the written shard, as compared by _sync
+        """
+        os.makedirs(self.shard_dir, exist_ok=True)
+
+        shard_path = self._shard_path(video_id)
+        temp_path = f'{shard_path}.tmp'
+        with open(temp_path, 'wb') as shard_file:
+            np.savez(shard_file, embeddings=vectors, starts=starts, texts=np.asarray(texts, dtype=str))
+
+        os.replace(temp_path, shard_path)
+        return self._shard_version(os.stat(shard_path))
+
+    @staticmethod
+    def _shard_version(stat: os.stat_result) -> Tuple[int, int, int]:
+        # replacing a shard gives it a new inode, mtime and usually size
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _touch_manifest(self) -> None:
+        """Mark the on-disk index as changed for other processes"""
+        os.makedirs(self.index_dir, exist_ok=True)
+
+        with open(self.manifest_path, 'a'):
+            os.utime(self.manifest_path)
+
+    def _sync(self) -> None:
+        """Load shards added or replaced and drop shards removed since the last sync"""
+        try:
+            version = os.stat(self.manifest_path).st_mtime_ns
+        except FileNotFoundError:
+            return
+
+        if version == self._manifest_version:
+            return
+
+        on_disk: Dict[str, Tuple[int, int, int]] = {}
+        if os.path.isdir(self.shard_dir):
+            with os.scandir(self.shard_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.npz'):
+                        try:
+                            on_disk[entry.name[:-len('.npz')]] = self._shard_version(entry.stat())
+                        except FileNotFoundError:
+                            # removed while listing
+                            continue
+
+        for video_id in set(self._shard_versions) - set(on_disk):
+            self._shard_versions.pop(video_id)
+            self._remove_rows(video_id)
+
+        for video_id, shard_version in on_disk.items():
+            if self._shard_versions.get(video_id) == shard_version:
+                continue
+
+            try:
+                with np.load(self._shard_path(video_id), allow_pickle=False) as shard:
+                    vectors, starts, texts = shard['embeddings'], shard['starts'], shard['texts'].tolist()
+            except Exception as e:
+                print(f"Error loading search index shard {video_id}: {str(e)}")
+                continue
+
+            self._remove_rows(video_id)
+            self._append_rows(video_id, vectors, starts, texts)
+            self._shard_versions[video_id] = shard_version
+
+        self._manifest_version = version
+
+    def _append_rows(
+        self,
+        video_id: str,
+        vectors: NDArray[np.float32],
+        starts: NDArray[np.float32],
+        texts: List[str]
+    ) -> None:
+        count = len(texts)
+        if count == 0:
+            self._rows_by_video[video_id] = np.zeros(0, dtype=np.intp)
+            return
+
+        if self._live_count == 0 and vectors.shape[1] != self._vectors.shape[1]:
+            # empty index adopts the dimension of the first embeddings it sees
+            self._reset(vectors.shape[1])
+
+        if vectors.shape[1] != self._vectors.shape[1]:
+            print(f"Skipping search index rows for {video_id}: embedding dimension mismatch")
+            return
+
+        needed = self._size + count
+        if needed > len(self._vectors):
+            self._grow(max(needed, 2 * len(self._vectors), self.MIN_CAPACITY))
+
+        rows = np.arange(self._size, needed)
+        self._vectors[rows] = vectors
+        self._starts[rows] = starts
+        self._alive[rows] = True
+        if self._centroids is not None:
+            for list_id, list_rows in self._group_rows(rows, self._nearest_centroids(vectors)).items():
+                self._lists[list_id].append(list_rows)
+
+        self._video_ids.extend([video_id] * count)
+        self._texts.extend(texts)
+        self._size = needed
+        self._live_count += count
+        self._rows_by_video[video_id] = rows
+
+        if not self._training and self._live_count >= self.TRAIN_THRESHOLD and (
+            self._centroids is None or self._live_count > 2 * self._trained_size
+        ):
+            self._training = True
+            threading.Thread(target=self._train, daemon=True).start()
+
+    def _remove_rows(self, video_id: str) -> None:
+        rows = self._rows_by_video.pop(video_id, None)
+        if rows is None or len(rows) == 0:
+            return
+
+        self._alive[rows] = False
+        self._live_count -= len(rows)
+
+        # reclaim space once most rows are dead
+        if self._size - self._live_count > max(self._live_count, self.MIN_CAPACITY):
+            self._compact()
+
+    def _reset(self, dim: int) -> None:
+        self._vectors = np.zeros((0, dim), dtype=np.float32)
+        self._starts = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._video_ids = []
+        self._texts = []
+        self._size = 0
+        self._rows_by_video = {video_id: rows for video_id, rows in self._rows_by_video.items() if len(rows) == 0}
+        self._centroids = None
+        self._lists = []
+        self._trained_size = 0
+        self._layout_generation += 1
+
+    def _grow(self, capacity: int) -> None:
+        vectors = np.zeros((capacity, self._vectors.shape[1]), dtype=np.float32)
+        vectors[:self._size] = self._vectors[:self._size]
+        self._vectors = vectors
+
+        for name, dtype in (('_starts', np.float32), ('_alive', bool)):
+            grown = np.zeros(capacity, dtype=dtype)
+            grown[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, grown)
+
+    def _compact(self) -> None:
+        keep = np.flatnonzero(self._alive[:self._size])
+
+        new_rows = np.full(self._size, -1, dtype=np.intp)
+        new_rows[keep] = np.arange(len(keep))
+
+        self._vectors = self._vectors[keep]
+        self._starts = self._starts[keep]
+        self._alive = self._alive[keep]
+        self._video_ids = [self._video_ids[row] for row in keep]
+        self._texts = [self._texts[row] for row in keep]
+        self._size = len(keep)
+        self._rows_by_video = {
+            video_id: new_rows[rows] for video_id, rows in self._rows_by_video.items()
+        }
+        for list_id in range(len(self._lists)):
+            list_rows = new_rows[self._list_rows(list_id)]
+            self._lists[list_id] = [list_rows[list_rows >= 0]]
+        self._layout_generation += 1
+
+    def _train(self) -> None:
+        """Fit spherical k-means centroids and rebuild the inverted lists
+
+        Runs on its own thread. The lock is only held to take a snapshot
+        and to install the result; rows below the snapshot size are never
+        rewritten in place, so they are read without it.
+        """
+        try:
+            with self._lock:
+                generation = self._layout_generation
+                size = self._size
+                vectors = self._vectors[:size]
+                live = np.flatnonzero(self._alive[:size])
+
+                nlist = int(np.clip(np.sqrt(len(live)), 16, 4096))
+                rng = np.random.default_rng(0)
+                sample_size = min(len(live), nlist * self.TRAINING_SAMPLES_PER_LIST)
+                sample = vectors[rng.choice(live, sample_size, replace=False)]
+
+            centroids = self._fit_centroids(sample, nlist, rng)
+
+            lists: List[List[NDArray[np.intp]]] = [[] for _ in range(nlist)]
+            for list_id, list_rows in self._group_rows(live, self._nearest_centroids(vectors[live], centroids)).items():
+                lists[list_id].append(list_rows)
+
+            with self._lock:
+                if generation != self._layout_generation:
+                    # rows were renumbered meanwhile, the next append retries
+                    return
+
+                # rows appended since the snapshot were listed under the old centroids
+                added = size + np.flatnonzero(self._alive[size:self._size])
+                for list_id, list_rows in self._group_rows(
+                    added, self._nearest_centroids(self._vectors[added], centroids)
+                ).items():
+                    lists[list_id].append(list_rows)
+
+                self._centroids = centroids
+                self._lists = lists
+                self._trained_size = len(live)
+        except Exception as e:
+            print(f"Search index training error: {str(e)}")
+        finally:
+            with self._lock:
+                self._training = False
+
+    def _fit_centroids(
+        self,
+        sample: NDArray[np.float32],
+        nlist: int,
+        rng: np.random.Generator
+    ) -> NDArray[np.float32]:
+        sample_size = len(sample)
+
+        centroids = sample[rng.choice(sample_size, nlist, replace=False)].copy()
+        for _ in range(self.KMEANS_ITERATIONS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            counts = np.bincount(labels, minlength=nlist)
+            empty = counts == 0
+
+            # per-cluster sums over the sample sorted by label
+            offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+            sums = np.zeros_like(centroids)
+            sums[~empty] = np.add.reduceat(
+                sample[np.argsort(labels, kind='stable')], offsets[~empty], axis=0
+            )
+
+            # re-seed empty clusters from random samples
+            sums[empty] = sample[rng.choice(sample_size, int(empty.sum()))]
+
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = sums / norms
+
+        return centroids.astype(np.float32)
+
+    def _nearest_centroids(
+        self,
+        vectors: NDArray[np.float32],
+        centroids: Optional[NDArray[np.float32]] = None
+    ) -> NDArray[np.int32]:
+        centroids = self._centroids if centroids is None else centroids
+        assignments = np.empty(len(vectors), dtype=np.int32)
+
+        for offset in range(0, len(vectors), self.ASSIGN_CHUNK_SIZE):
+            chunk = vectors[offset:offset + self.ASSIGN_CHUNK_SIZE]
+            assignments[offset:offset + len(chunk)] = np.argmax(chunk @ centroids.T, axis=1)
+
+        return assignments
@@ -1,25 +1,34 @@
-from typing import Dict, Optional, List, Set, Union, TypedDict, Any, Mapping
-import whisper
-import spacy
-from spacy.tokens import Doc, Token
-from sentence_transformers import SentenceTransformer
+from typing import Dict, Optional, List, Set, Tuple, Union, TypedDict, Any, Mapping, Callable, Awaitable
+from .inference_executor import InferenceExecutor, InferenceQueueFull, get_inference_executor, get_ingest_executor
+from .embedding_batcher import EmbeddingBatcher
+from .lru_cache import LRUCache
+from .audio_extractor import AudioExtractor
+from .model_registry import ModelRegistry, get_model_registry
+from .chunked_transcription import ChunkedTranscriber, get_chunked_transcriber, plan_windows, stitch
+from django.conf import settings
 import numpy as np
 from numpy.typing import NDArray
-from sklearn.metrics.pairwise import cosine_similarity
+import asyncio
+import uuid
 
 class TranscriptSegment(TypedDict):
     """Type definition for a transcript segment"""
     text: str
     start: float
-    embedding: List[float]
 
 class TranscriptResult(TypedDict):
     """Type definition for transcript generation result"""
     text: str
     segments: List[TranscriptSegment]
+    embeddings: NDArray[np.float32]
+    focus_index: Dict[str, List[int]]
+    version: str
     success: bool
     error: Optional[str]
 
+# called with (transcript so far, segments new since the last call, seconds of audio transcribed)
+PartialTranscriptCallback = Callable[[TranscriptResult, List[TranscriptSegment], float], Awaitable[None]]
+
 class SearchMatch(TypedDict):
     """Type definition for search result match"""
     timestamp: float
@@ -35,12 +44,39 @@ class QuestionComponents(TypedDict):
     context: List[str]
     
 class TranscriptService:
+    # number of matches returned by search_transcript
+    SEARCH_TOP_K: int = 3
+    # minimum (boosted) cosine similarity for a segment to count as a match
+    MIN_CONFIDENCE: float = 0.3
+    # score multiplier for segments containing the question's focus words
+    FOCUS_WORD_BOOST: float = 1.2
+
     def __init__(self):
         
-        self.whisper_model: whisper.Whisper = whisper.load_model("base")
-        self.nlp: spacy.language.Language = spacy.load("en_core_web_sm")
-        self.semantic_model: SentenceTransformer = SentenceTransformer('all-MiniLM-L6-v2')
+        # models are shared by every service in the process and loaded on first use
+        self.models: ModelRegistry = get_model_registry()
+        
+        # every model call goes through one of these to keep the event loop free,
+        # queries and ingest on separate pools so transcription never delays a search
+        self.executor: InferenceExecutor = get_inference_executor()
+        self.ingest_executor: InferenceExecutor = get_ingest_executor()
+        
+        # long audio is split across a process pool when enabled
+        self.chunked_transcriber: Optional[ChunkedTranscriber] = get_chunked_transcriber(settings.WHISPER_MODEL)
         
+        # concurrent search queries share one forward pass
+        self.query_batcher: EmbeddingBatcher = EmbeddingBatcher(
+            self._encode_texts,
+            self.executor,
+            max_batch_size=settings.QUERY_BATCH_MAX_SIZE,
+            max_wait=settings.QUERY_BATCH_MAX_WAIT_MS / 1000
+        )
+        
+        # parsed components and embedding per normalized query
+        self.query_cache: LRUCache[str, Tuple[QuestionComponents, NDArray[np.float32]]] = LRUCache(
+            settings.QUERY_CACHE_MAX_SIZE,
+            ttl=settings.QUERY_CACHE_TTL
+        )
         
         # question patterns and their focus words
         self.question_patterns = {
@@ -52,30 +88,42 @@ class TranscriptService:
             'why': ['reason', 'cause', 'because', 'purpose']
         }
         
-    async def generate_transcript(self, video_path: str) -> TranscriptResult:
+    async def generate_transcript(
+        self,
+        audio_path: str,
+        on_partial: Optional[PartialTranscriptCallback] = None
+    ) -> TranscriptResult:
         """Generate transcript from video file with enhanced segment processing
         
         Args:
-            video_path: Path to the video file
+            audio_path: 16 kHz mono PCM file written by AudioExtractor
+            on_partial: Awaited after each window of audio longer than one
+                TRANSCRIPTION_WINDOW_SECONDS window with the transcript so far
+                (marked 'partial'), its new segments and the seconds
+                processed; an exception it raises stops transcription
             
         Returns:
             Dictionary containing transcript text, segments, and status
         """
         try:
-            result = self.whisper_model.transcribe(video_path)
+            if on_partial is not None and self._spans_windows(audio_path):
+                return await self._generate_incremental(audio_path, on_partial)
             
-            enhanced_segments = []
-            for segment in result['segments']:
-                
-                # generate embedding and convert to numpy array for serialization
-                embedding = self.semantic_model.encode(segment['text'])  
-                
-                segment['embedding'] = embedding.tolist()  
-                enhanced_segments.append(segment)
+            if self.chunked_transcriber and self.chunked_transcriber.should_chunk(audio_path):
+                result = await self.chunked_transcriber.transcribe(audio_path)
+            else:
+                result = await self.ingest_executor.run(self._transcribe_audio, audio_path)
+            
+            segments = result['segments']
+            embedding_matrix = await self.ingest_executor.run(self._embed_segments, segments)
+            focus_index = await self.ingest_executor.run(self._build_focus_index, segments)
             
             return {
                 'text': result['text'],
-                'segments': enhanced_segments,
+                'segments': segments,
+                'embeddings': embedding_matrix,
+                'focus_index': focus_index,
+                'version': uuid.uuid4().hex,
                 'success': True
             }
         except Exception as e:
@@ -87,6 +135,219 @@ class TranscriptService:
                 'error': str(e)
             }
 
+    async def _generate_incremental(
+        self,
+        audio_path: str,
+        on_partial: PartialTranscriptCallback
+    ) -> TranscriptResult:
+        """Transcribe audio window by window, reporting windows as they complete
+        
+        Args:
+            audio_path: 16 kHz mono PCM file written by AudioExtractor
+            on_partial: Callback given to generate_transcript
+            
+        Returns:
+            The complete transcript
+            
+        Note:
+            With the chunked transcriber, windows run in parallel on its
+            pool; otherwise they are transcribed one after another on the
+            ingest executor. Either way they are reported in order.
+            Stitching a longer prefix never changes earlier segments, so only
+            new segments are embedded and appended to the matrix and focus
+            index.
+        """
+        pending: List[asyncio.Future] = []
+        if self.chunked_transcriber:
+            windows = await asyncio.to_thread(self.chunked_transcriber.plan_windows, audio_path)
+            pending = self.chunked_transcriber.submit(audio_path, windows)
+        else:
+            windows = await asyncio.to_thread(
+                plan_windows,
+                audio_path,
+                settings.TRANSCRIPTION_WINDOW_SECONDS,
+                settings.TRANSCRIPTION_OVERLAP_SECONDS,
+                settings.TRANSCRIPTION_SPLIT_SEARCH_SECONDS
+            )
+        
+        results: List[Dict[str, Any]] = []
+        segments: List[Dict[str, Any]] = []
+        embedding_matrix = np.zeros((0, 0), dtype=np.float32)
+        focus_index: Dict[str, List[int]] = {question_type: [] for question_type in self.question_patterns}
+        
+        try:
+            for position, (load_start, _, end) in enumerate(windows):
+                if pending:
+                    results.append(await pending[position])
+                else:
+                    results.append(await self.ingest_executor.run(
+                        self.models.transcribe, audio_path, load_start, end - load_start
+                    ))
+                
+                stitched = stitch(windows[:position + 1], results)
+                new_segments = stitched['segments'][len(segments):]
+                
+                if new_segments:
+                    new_embeddings = await self.ingest_executor.run(self._embed_segments, new_segments)
+                    new_focus = await self.ingest_executor.run(self._build_focus_index, new_segments)
+                    
+                    embedding_matrix = (
+                        np.vstack([embedding_matrix, new_embeddings]) if len(segments) else new_embeddings
+                    )
+                    for question_type, indices in new_focus.items():
+                        focus_index[question_type].extend(index + len(segments) for index in indices)
+                    segments = stitched['segments']
+                
+                transcript = {
+                    'text': stitched['text'],
+                    'segments': segments,
+                    'embeddings': embedding_matrix,
+                    'focus_index': {question_type: list(indices) for question_type, indices in focus_index.items()},
+                    'version': uuid.uuid4().hex,
+                    'success': True
+                }
+                
+                # the last window's segments arrive with the complete transcript
+                if new_segments and position < len(windows) - 1:
+                    await on_partial(
+                        {**transcript, 'partial': True},
+                        new_segments,
+                        end / AudioExtractor.SAMPLE_RATE
+                    )
+        finally:
+            # windows still queued after a failure are not needed
+            for future in pending:
+                future.cancel()
+        
+        return transcript
+
+    @staticmethod
+    def _spans_windows(audio_path: str) -> bool:
+        """Check whether audio is longer than one transcription window
+        
+        Args:
+            audio_path: 16 kHz mono PCM file written by AudioExtractor
+            
+        Returns:
+            True if it would be cut into more than one window
+        """
+        return AudioExtractor.duration(audio_path) > (
+            settings.TRANSCRIPTION_WINDOW_SECONDS + settings.TRANSCRIPTION_SPLIT_SEARCH_SECONDS
+        )
+
+    def _transcribe_audio(self, audio_path: str) -> Dict[str, Any]:
+        """Run Whisper over a whole cached audio file
+        
+        Args:
+            audio_path: 16 kHz mono PCM file written by AudioExtractor
+            
+        Returns:
+            Whisper result with text, segments and language
+        """
+        return self.models.transcribe(audio_path)
+
+    async def reembed_transcript(self, transcript: Dict[str, Any]) -> Dict[str, Any]:
+        """Recompute embeddings and focus index for an existing transcript
+        
+        Args:
+            transcript: Video transcript data
+            
+        Returns:
+            Copy of the transcript with fresh embeddings, focus index and version
+        """
+        segments = transcript.get('segments', [])
+        embedding_matrix = await self.ingest_executor.run(self._embed_segments, segments)
+        focus_index = await self.ingest_executor.run(self._build_focus_index, segments)
+        
+        # drop per-segment embeddings left over from the old layout
+        segments = [
+            {key: value for key, value in segment.items() if key != 'embedding'}
+            for segment in segments
+        ]
+        
+        return {
+            **transcript,
+            'segments': segments,
+            'embeddings': embedding_matrix,
+            'focus_index': focus_index,
+            'version': uuid.uuid4().hex
+        }
+
+    def _embed_segments(self, segments: List[Mapping[str, Any]]) -> NDArray[np.float32]:
+        """Embed transcript segments in batched forward passes
+        
+        Args:
+            segments: Transcript segments
+            
+        Returns:
+            float32 matrix with one unit-length row per segment
+        """
+        if not segments:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        # one row per segment, unit length so search is a single dot product
+        return self._normalize_rows(self.models.encode(
+            [segment['text'] for segment in segments],
+            batch_size=settings.SEGMENT_EMBEDDING_BATCH_SIZE
+        ))
+
+    @staticmethod
+    def _normalize_rows(matrix: NDArray[np.float32]) -> NDArray[np.float32]:
+        """Scale each row of a matrix to unit length
+        
+        Args:
+            matrix: 2D array of embeddings
+            
+        Returns:
+            float32 matrix whose rows have L2 norm 1 (zero rows are left as is)
+        """
+        matrix = np.asarray(matrix, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def _embedding_matrix(self, transcript: Mapping[str, Any]) -> NDArray[np.float32]:
+        """Get the normalized segment embedding matrix for a transcript
+        
+        Args:
+            transcript: Video transcript data
+            
+        Returns:
+            float32 matrix with one unit-length row per segment
+            
+        Note:
+            Transcripts generated before the matrix was stored keep their
+            embeddings on each segment, those are stacked and normalized here.
+        """
+        if transcript.get('embeddings') is not None:
+            return np.asarray(transcript['embeddings'], dtype=np.float32)
+        
+        segments = transcript.get('segments', [])
+        return self._normalize_rows(
+            np.asarray([segment['embedding'] for segment in segments], dtype=np.float32)
+        )
+
+    def _build_focus_index(self, segments: List[Mapping[str, Any]]) -> Dict[str, List[int]]:
+        """Map each question type to the segments containing its focus words
+        
+        Args:
+            segments: Transcript segments
+            
+        Returns:
+            Dictionary of question type to sorted segment indices
+        """
+        focus_index = {question_type: [] for question_type in self.question_patterns}
+        
+        texts = (segment['text'].lower() for segment in segments)
+        for index, segment_doc in enumerate(self.models.nlp.pipe(texts)):
+            segment_words = {token.text for token in segment_doc}
+            
+            for question_type, focus_words in self.question_patterns.items():
+                if any(word in segment_words for word in focus_words):
+                    focus_index[question_type].append(index)
+        
+        return focus_index
+
     def _extract_question_components(self, query: str) -> QuestionComponents:
         """Extract key components from a question for better matching
         
@@ -97,7 +358,7 @@ class TranscriptService:
             Dictionary containing question type and components
         """
         
-        doc = self.nlp(query.lower())
+        doc = self.models.nlp(query.lower())
         
         components = {
             'question_type': None,
@@ -150,6 +411,49 @@ class TranscriptService:
         return ' '.join(set(query_parts))
 
 
+    async def encode_query(self, query: str) -> Tuple[QuestionComponents, NDArray[np.float32]]:
+        """Parse a query and embed its augmented form
+        
+        Args:
+            query: User's search query
+            
+        Returns:
+            Tuple of (question components, unit-length query embedding)
+            
+        Note:
+            Results are cached per normalized query and shared between
+            callers, so neither element may be mutated.
+        """
+        normalized_query = ' '.join(query.lower().split())
+        
+        cached = self.query_cache.get(normalized_query)
+        if cached is not None:
+            return cached
+        
+        question_components = await self.executor.run(
+            self._extract_question_components, normalized_query
+        )
+        augmented_query = self._augment_query(question_components)
+        
+        query_embedding = await self.query_batcher.encode(augmented_query)
+        query_embedding.setflags(write=False)
+        
+        self.query_cache.set(normalized_query, (question_components, query_embedding))
+        return question_components, query_embedding
+
+    def _encode_texts(self, texts: List[str]) -> NDArray[np.float32]:
+        """Encode a batch of texts in one forward pass
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            float32 matrix with one unit-length row per text
+        """
+        return self._normalize_rows(
+            self.models.encode(texts, batch_size=len(texts))
+        )
+
     async def search_transcript(
         self, 
         query: str, 
@@ -163,49 +467,47 @@ class TranscriptService:
             
         Returns:
             List of matching segments with timestamps and confidence scores
+            
+        Raises:
+            InferenceQueueFull: If the models are too busy to take the query
         """
         try:
             segments = transcript.get('segments', [])
             if not segments:
                 return []
 
-            question_components = self._extract_question_components(query)
-            augmented_query = self._augment_query(question_components)
+            question_components, query_embedding = await self.encode_query(query)
             
-            # generate query embedding as numpy array
-            query_embedding = self.semantic_model.encode(augmented_query)
+            # cosine similarity of every segment in one matrix-vector product
+            similarities = self._embedding_matrix(transcript) @ query_embedding
             
-            matches = []
-            for segment in segments:
-                segment_embedding = np.array(segment['embedding'])
-                
-                # calculate similarity
-                similarity = cosine_similarity(
-                    query_embedding.reshape(1, -1),
-                    segment_embedding.reshape(1, -1)
-                )[0][0]
+            if question_components['question_type'] in self.question_patterns:
+                # transcripts cached before the index existed are tokenized here
+                focus_index = (
+                    transcript.get('focus_index') or
+                    await self.executor.run(self._build_focus_index, segments)
+                )
                 
                 # segment contains question-relevant words then increase score
-                segment_doc = self.nlp(segment['text'].lower())
-                segment_words = {token.text for token in segment_doc}
-                
-                if question_components['question_type'] in self.question_patterns:
-                    focus_words = self.question_patterns[question_components['question_type']]
-                    
-                    if any(word in segment_words for word in focus_words):
-                        similarity *= 1.2
-                
-                if similarity > 0.3:
-                    matches.append({
-                        'timestamp': segment['start'],
-                        'text': segment['text'],
-                        'confidence': float(similarity),
-                        'question_type': question_components['question_type']
-                    })
+                focus_segments = focus_index.get(question_components['question_type'], [])
+                similarities[focus_segments] *= self.FOCUS_WORD_BOOST
+            
+            candidates = np.flatnonzero(similarities > self.MIN_CONFIDENCE)
+            if len(candidates) > self.SEARCH_TOP_K:
+                top = np.argpartition(-similarities[candidates], self.SEARCH_TOP_K - 1)
+                candidates = candidates[top[:self.SEARCH_TOP_K]]
+            
+            candidates = candidates[np.argsort(-similarities[candidates], kind='stable')]
             
-            sorted_matches = sorted(matches, key=lambda x: x['confidence'], reverse=True)
-            return sorted_matches[:3]
+            return [{
+                'timestamp': segments[index]['start'],
+                'text': segments[index]['text'],
+                'confidence': float(similarities[index]),
+                'question_type': question_components['question_type']
+            } for index in candidates]
 
+        except InferenceQueueFull:
+            raise
         except Exception as e:
             print(f"Transcript search error: {e}")
             return []
\ No newline at end of file
@@ -1,8 +1,13 @@
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
+import base64
+import json
 import os
-from typing import List, Dict, Optional, TypedDict
-from moviepy.editor import VideoFileClip
+from typing import Any, List, Dict, Optional, Tuple, TypedDict
 from django.conf import settings
+from django.db.models import Q
+from apps.videos.models import Video
+from .media_probe import MediaProbe
 
 class VideoMetadata(TypedDict):
     """Type definition for video metadata"""
@@ -16,76 +21,277 @@ class VideoMetadata(TypedDict):
     created_at: str
     processing_status: str
 
+class ReconcileResult(TypedDict):
+    """Type definition for catalog reconciliation result"""
+    added: int
+    removed: int
+
 class VideoFileManager:
     VALID_VIDEO_EXTENSIONS: tuple[str, ...] = ('.mp4', '.mov', '.avi')
+    SORT_FIELDS: tuple[str, ...] = ('created_at', 'duration', 'file_size')
 
     @staticmethod
-    async def read_all_videos(limit: Optional[int] = None) -> List[VideoMetadata]:
-        """Read metadata for all videos in the media directory
-        
+    async def read_videos(
+        limit: int,
+        sort: str = 'created_at',
+        descending: bool = True,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        min_duration: Optional[float] = None,
+        max_duration: Optional[float] = None,
+        title_prefix: Optional[str] = None
+    ) -> Tuple[List[VideoMetadata], Optional[str]]:
+        """Read one page of videos from the catalog
+
         Args:
-            limit: Optional maximum number of videos to return
-            
+            limit: Maximum number of videos to return
+            sort: Field to sort by, one of SORT_FIELDS
+            descending: Whether to sort in descending order
+            cursor: Cursor returned with the previous page, if any
+            status: Only return videos with this processing status
+            min_duration: Only return videos at least this many seconds long
+            max_duration: Only return videos at most this many seconds long
+            title_prefix: Only return videos whose title starts with this,
+                ignoring case
+
         Returns:
-            List of video information dictionaries sorted by creation date
-            
+            Tuple of (videos on this page, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the sort field or cursor is invalid
+
         Note:
-            Videos are sorted by created_at in descending order (newest first)
+            Keyset pagination on (sort field, video_id): each page is an
+            indexed range scan of limit + 1 rows, whatever the page depth.
+            Failed uploads are left out unless status asks for them.
+        """
+        if sort not in VideoFileManager.SORT_FIELDS:
+            raise ValueError(f"sort must be one of {', '.join(VideoFileManager.SORT_FIELDS)}")
+
+        videos = Video.objects.all()
+
+        if status:
+            videos = videos.filter(processing_status=status)
+        else:
+            videos = videos.exclude(processing_status='failed')
+
+        if min_duration is not None:
+            videos = videos.filter(duration__gte=min_duration)
+        if max_duration is not None:
+            videos = videos.filter(duration__lte=max_duration)
+        if title_prefix:
+            # a range on title_key, unlike LIKE this can use its index
+            prefix = Video.normalize_title(title_prefix)
+            videos = videos.filter(title_key__gte=prefix)
+
+            upper = VideoFileManager._prefix_upper_bound(prefix)
+            if upper is not None:
+                videos = videos.filter(title_key__lt=upper)
+
+        lookup = 'lt' if descending else 'gt'
+        if cursor:
+            value, video_id = VideoFileManager._decode_cursor(cursor, sort, descending)
+            videos = videos.filter(
+                Q(**{f'{sort}__{lookup}': value}) |
+                Q(**{sort: value, f'video_id__{lookup}': video_id})
+            )
+
+        direction = '-' if descending else ''
+        videos = videos.order_by(f'{direction}{sort}', f'{direction}video_id')[:limit + 1]
+
+        rows = [video async for video in videos]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = VideoFileManager._encode_cursor(rows[-1], sort, descending)
+
+        return [video.to_dict() for video in rows], next_cursor
+
+    @staticmethod
+    def _prefix_upper_bound(prefix: str) -> Optional[str]:
+        """Get the smallest string above every string starting with prefix
+
+        Args:
+            prefix: Non-empty prefix
+
+        Returns:
+            The bound in code point order, or None if there is none
+        """
+        for position in range(len(prefix) - 1, -1, -1):
+            code = ord(prefix[position]) + 1
+            if 0xD800 <= code <= 0xDFFF:
+                # surrogates cannot be stored
+                code = 0xE000
+
+            if code <= 0x10FFFF:
+                return prefix[:position] + chr(code)
+
+        return None
+
+    @staticmethod
+    def _encode_cursor(video: Video, sort: str, descending: bool) -> str:
+        value = getattr(video, sort)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+
+        payload = json.dumps({'sort': sort, 'desc': descending, 'value': value, 'id': video.video_id})
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    @staticmethod
+    def _decode_cursor(cursor: str, sort: str, descending: bool) -> Tuple[Any, str]:
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            value, video_id = payload['value'], str(payload['id'])
+
+            if sort == 'created_at':
+                value = datetime.fromisoformat(value)
+        except Exception:
+            raise ValueError('Invalid cursor')
+
+        if payload.get('sort') != sort or payload.get('desc') != descending:
+            raise ValueError('Cursor does not match the requested sort order')
+
+        return value, video_id
+
+    @staticmethod
+    async def save_video(video_id: str, **fields: Any) -> None:
+        """Create or update a video's catalog entry
+
+        Args:
+            video_id: ID of the video
+            **fields: Catalog fields to set
+        """
+        await Video.objects.aupdate_or_create(video_id=video_id, defaults=fields)
+
+    @staticmethod
+    async def update_video(video_id: str, **fields: Any) -> bool:
+        """Update an existing catalog entry without creating one
+
+        Args:
+            video_id: ID of the video
+            **fields: Catalog fields to set
+
+        Returns:
+            False if the video has no catalog entry
+        """
+        return await Video.objects.filter(video_id=video_id).aupdate(**fields) > 0
+
+    @staticmethod
+    async def update_status(video_id: str, processing_status: str) -> bool:
+        """Update the processing status of a catalog entry
+
+        Args:
+            video_id: ID of the video
+            processing_status: New processing status
+
+        Returns:
+            False if the video has no catalog entry
+        """
+        return await VideoFileManager.update_video(video_id, processing_status=processing_status)
+
+    @staticmethod
+    async def read_unfinished() -> List[VideoMetadata]:
+        """Read the catalog entries of videos still queued or processing
+
+        Returns:
+            Their catalog entries, oldest first
+        """
+        videos = Video.objects.filter(processing_status__in=('queued', 'processing')).order_by('created_at')
+        return [video.to_dict() async for video in videos]
+
+    @staticmethod
+    async def exists(video_id: str) -> bool:
+        """Check whether a video has a catalog entry
+
+        Args:
+            video_id: ID of the video
+        """
+        return await Video.objects.filter(video_id=video_id).aexists()
+
+    @staticmethod
+    async def remove_video(video_id: str) -> None:
+        """Remove a video's catalog entry
+
+        Args:
+            video_id: ID of the video
+        """
+        await Video.objects.filter(video_id=video_id).adelete()
+
+    @staticmethod
+    def find_video_file(video_dir: str) -> Optional[str]:
+        """Find the video file in a video's directory
+
+        Args:
+            video_dir: Directory holding the video upload
+
+        Returns:
+            Name of the video file or None if there is none
+        """
+        video_files = [f for f in os.listdir(video_dir)
+                     if f.endswith(VideoFileManager.VALID_VIDEO_EXTENSIONS)
+                     and not f.startswith('.')]
+
+        return video_files[0] if video_files else None
+
+    @staticmethod
+    async def reconcile_catalog() -> ReconcileResult:
+        """Sync the catalog with the media directory
+
+        Returns:
+            Counts of catalog entries added and removed
+
+        Note:
+            Videos copied into the media directory out-of-band are probed and
+            added as completed; entries whose files are gone are removed.
+            Only new files are opened, so this is cheap to run repeatedly.
         """
-        
-        videos = []
         videos_dir = os.path.join(settings.MEDIA_ROOT, 'videos')
-        
-        if not os.path.exists(videos_dir):
-            return []
-            
-        # look through all UUID directories
-        for video_id in os.listdir(videos_dir):
-            video_dir = os.path.join(videos_dir, video_id)
-            
-            if not os.path.isdir(video_dir):
-                continue
-                
-            # find video file in directory
-            video_files = [f for f in os.listdir(video_dir) 
-                         if f.endswith(VideoFileManager.VALID_VIDEO_EXTENSIONS) 
-                         and not f.startswith('.')]
-                         
-            if not video_files:
-                continue
-                
-            video_file = video_files[0] 
-            video_path = os.path.join(video_dir, video_file)
-            
+        on_disk = {}
+
+        if os.path.exists(videos_dir):
+            for video_id in os.listdir(videos_dir):
+                video_dir = os.path.join(videos_dir, video_id)
+
+                if os.path.isdir(video_dir):
+                    video_file = VideoFileManager.find_video_file(video_dir)
+                    if video_file:
+                        on_disk[video_id] = video_file
+
+        catalog_ids = {video_id async for video_id in Video.objects.values_list('video_id', flat=True)}
+
+        removed = len(catalog_ids - set(on_disk))
+        if removed:
+            await Video.objects.filter(video_id__in=catalog_ids - set(on_disk)).adelete()
+
+        added = 0
+        for video_id in set(on_disk) - catalog_ids:
+            video_file = on_disk[video_id]
+            video_path = os.path.join(videos_dir, video_id, video_file)
+
             try:
                 stats = os.stat(video_path)
-                
-                # get video metadata using moviepy
-                clip = VideoFileClip(video_path)
-
-                video_info = {
-                    'video_id': video_id,
-                    'original_filename': video_file,
-                    'title': os.path.splitext(video_file)[0],
-                    'file_size': stats.st_size,
-                    'duration': clip.duration,
-                    'width': clip.w,
-                    'height': clip.h,
-                    'created_at': datetime.fromtimestamp(stats.st_ctime).isoformat(),
-                    'processing_status': 'completed'
-                }
-                
-                clip.close()
-                videos.append(video_info)
-                
+
+                # container metadata only, nothing is decoded
+                media_info = await asyncio.to_thread(MediaProbe.probe, video_path)
+
+                await VideoFileManager.save_video(
+                    video_id,
+                    original_filename=video_file,
+                    title=os.path.splitext(video_file)[0],
+                    file_size=stats.st_size,
+                    duration=media_info['duration'],
+                    width=media_info['width'],
+                    height=media_info['height'],
+                    created_at=datetime.fromtimestamp(stats.st_ctime, tz=timezone.utc),
+                    processing_status='completed'
+                )
+                added += 1
+
             except Exception as e:
                 print(f"Error reading video metadata for {video_path}: {str(e)}")
                 continue
-        
-        # Sort by created_at descending
-        videos.sort(key=lambda x: x['created_at'])
-        
-        if limit and limit > 0:
-            videos = videos[:limit]
-            
-        return videos
\ No newline at end of file
+
+        return {
+            'added': added,
+            'removed': removed
+        }
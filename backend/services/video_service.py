@@ -1,14 +1,23 @@
 from .cache_service import CacheService
-from .transcript_service import TranscriptService
+from .transcript_service import TranscriptService, TranscriptResult, TranscriptSegment, SearchMatch
 from typing import Dict, Optional, List, Tuple, TypedDict, Any, Union
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
+import hashlib
 import os
-from moviepy.editor import VideoFileClip
+import shutil
+import threading
 from django.conf import settings
+from channels.layers import get_channel_layer
 from PIL import Image
 import cv2
 import numpy as np
 from .video_file_manager import VideoFileManager
+from .search_index import SearchIndex, SegmentHit
+from .media_probe import MediaProbe, MediaProbeError, MediaTooLong
+from .audio_extractor import AudioExtractor
+from utils.http_range import parse_range_header
+from .processing_queue import ProcessingQueue, ProcessingQueueFull, get_processing_queue
 
 class VideoFileInfo(TypedDict):
     """Type definition for video file information"""
@@ -27,7 +36,6 @@ class VideoMetadata(TypedDict):
     width: int
     height: int
     created_at: str
-    transcript: Dict[str, Any]
     processing_status: str
     thumbnail: str
 
@@ -37,11 +45,14 @@ class ProcessingStatus(TypedDict):
     video_id: str
     status: str
     progress: int
+    duration: Optional[float]
+    transcribed_seconds: float
 
 class ProcessingResult(TypedDict, total=False):
     """Type definition for processing result"""
     success: bool
     error: Optional[str]
+    retryable: Optional[bool]
     video_id: Optional[str]
     original_filename: Optional[str]
     file_size: Optional[int]
@@ -49,21 +60,33 @@ class ProcessingResult(TypedDict, total=False):
     width: Optional[int]
     height: Optional[int]
     created_at: Optional[str]
-    transcript: Optional[Dict[str, Any]]
     processing_status: Optional[str]
     thumbnail: Optional[str]
 
+class VideoPage(TypedDict):
+    """Type definition for a page of the video listing"""
+    videos: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
 class DeleteResult(TypedDict):
     """Type definition for delete operation result"""
     success: bool
     message: Optional[str]
     error: Optional[str]
 
+class VideoDeleted(Exception):
+    """Raised when a video is deleted while it is being processed"""
+
 class VideoService:
+    # longest video accepted for processing, in seconds
+    MAX_VIDEO_DURATION: float = 180
+
     def __init__(self):
         self.cache_service: CacheService = CacheService()
         self.transcript_service: TranscriptService = TranscriptService()
         self.video_file_manager: VideoFileManager = VideoFileManager()
+        self.search_index: SearchIndex = SearchIndex()
+        self.processing_queue: ProcessingQueue = get_processing_queue()
         self.video_cache: Dict[str, Dict[str, Any]] = {}
 
 
@@ -118,68 +141,283 @@ class VideoService:
             range_header: HTTP range header
             
         Returns:
-            Tuple of (first_byte, last_byte, length)
-        """
-        try:
-            first_byte = 0
-            last_byte = file_size - 1
-            length = file_size
+            Tuple of (first_byte, last_byte, length) of the first requested
+            range, or of the whole file if the header is missing or invalid
             
-            if range_header:
-                range_match = range_header.strip().replace('bytes=', '').split('-')
-                
-                if len(range_match) == 2:
-                    first_byte = int(range_match[0]) if range_match[0] else 0
-                    last_byte = int(range_match[1]) if range_match[1] else file_size - 1
-                    length = last_byte - first_byte + 1
-                    
-            return first_byte, last_byte, length
+        Raises:
+            ValueError: If no requested range is satisfiable
             
-        except Exception as e:
-            print(f"Error handling range request: {str(e)}")
+        Note:
+            Parsing is done by utils.http_range, which stream_video uses
+            directly for multi-range and conditional requests.
+        """
+        ranges = parse_range_header(range_header, file_size) if range_header else None
+        
+        if ranges is None:
             return 0, file_size - 1, file_size
+        if not ranges:
+            raise ValueError('Requested range not satisfiable')
+        
+        first_byte, last_byte = ranges[0]
+        return first_byte, last_byte, last_byte - first_byte + 1
         
-    async def get_all_videos(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get all videos from cache
+    async def get_all_videos(
+        self,
+        limit: int,
+        sort: str = 'created_at',
+        descending: bool = True,
+        cursor: Optional[str] = None,
+        **filters: Any
+    ) -> VideoPage:
+        """Get one page of videos from the catalog
         
         Args:
-            limit: Optional maximum number of videos to return
+            limit: Maximum number of videos to return
+            sort: Field to sort by (created_at, duration or file_size)
+            descending: Whether to sort in descending order
+            cursor: Cursor returned with the previous page, if any
+            **filters: status, min_duration, max_duration and title_prefix
             
         Returns:
-            List of video information dictionaries
+            Dictionary with the page of videos and the next page's cursor
+            
+        Raises:
+            ValueError: If the sort field or cursor is invalid
         """
+        videos, next_cursor = await self.video_file_manager.read_videos(
+            limit,
+            sort=sort,
+            descending=descending,
+            cursor=cursor,
+            **filters
+        )
+        
+        # only unfinished videos have progress to read, one MGET for those on the page
+        unfinished = [
+            f"video_{video['video_id']}" for video in videos
+            if video['processing_status'] in ('queued', 'processing')
+        ]
+        cached = await self.cache_service.get_many(unfinished) if unfinished else {}
+        
+        for video in videos:
+            cached_info = cached.get(f"video_{video['video_id']}")
+            
+            if isinstance(cached_info, dict):
+                video['processing_progress'] = cached_info.get('processing_progress', 0)
+            else:
+                video['processing_progress'] = 100 if video['processing_status'] == 'completed' else 0
+        
+        return {
+            'videos': videos,
+            'next_cursor': next_cursor
+        }
+    
+    async def enqueue_video(
+        self,
+        file_path: str,
+        video_id: str,
+        original_filename: str,
+        sha256: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Record an uploaded video as queued and process it in the background
+        
+        Args:
+            file_path: Path to video file
+            video_id: Unique identifier for video
+            original_filename: Original name of uploaded file
+            sha256: Hex SHA-256 of the file, if it was hashed on upload
+            
+        Returns:
+            The queued video record
+            
+        Raises:
+            ProcessingQueueFull: If the processing queue is at capacity
+        """
+        created_at = datetime.now(timezone.utc)
+        record = {
+            'video_id': video_id,
+            'original_filename': original_filename,
+            'created_at': created_at.isoformat(),
+            'sha256': sha256,
+            'processing_status': 'queued',
+            'processing_progress': 0
+        }
+
+        await self.cache_service.set(f"video_{video_id}", record)
+        await self.video_file_manager.save_video(
+            video_id,
+            original_filename=original_filename,
+            title=os.path.splitext(original_filename)[0],
+            file_size=os.path.getsize(file_path),
+            created_at=created_at,
+            sha256=sha256 or '',
+            processing_status='queued'
+        )
+        
         try:
-            videos = await self.video_file_manager.read_all_videos(limit)
+            self._submit_processing(file_path, video_id, original_filename)
+        except Exception:
+            await self.cache_service.delete(f"video_{video_id}")
+            await self.video_file_manager.remove_video(video_id)
+            raise
+
+        return record
+
+    def _submit_processing(self, file_path: str, video_id: str, original_filename: str) -> None:
+        """Queue a recorded video's processing job
+        
+        Args:
+            file_path: Path to video file
+            video_id: Unique identifier for video
+            original_filename: Original name of uploaded file
             
-            for video in videos:
-                try:
-                    cached_info = await self.cache_service.get(f"video_{video['video_id']}")
-                    
-                    if cached_info:
-                        video.update({
-                            'transcript': cached_info.get('transcript'),
-                            'thumbnail': cached_info.get('thumbnail')
-                        })
-                
-                except Exception as e:
-                    print(f"Error getting cache info for video {video['video_id']}: {str(e)}")
-                    continue
+        Raises:
+            ProcessingQueueFull: If the processing queue is at capacity
+        """
+        async def process() -> ProcessingResult:
+            return await self.process_video(file_path, video_id, original_filename)
+
+        async def on_failure(result: ProcessingResult) -> None:
+            await self._fail_processing(video_id, result.get('error'))
+
+        self.processing_queue.submit(process, on_failure=on_failure)
+
+    async def _fail_processing(self, video_id: str, error: Optional[str]) -> None:
+        """Clean up after a video that could not be processed
+        
+        Args:
+            video_id: ID of the video
+            error: Reason reported by the status endpoint
             
-            sorted_videos = sorted(
-                videos,
-                key=lambda x: x.get('created_at', ''),
-                reverse=True
+        Note:
+            The whole video directory goes, with the upload, its decoded
+            audio and any thumbnail. The record is kept so status reports
+            the failure.
+        """
+        video_dir = os.path.join(settings.MEDIA_ROOT, 'videos', video_id)
+        await asyncio.to_thread(shutil.rmtree, video_dir, True)
+
+        # drop any partial transcript stored while it was processing
+        await self.cache_service.delete_many([f"transcript_{video_id}", f"embeddings_{video_id}"])
+        await asyncio.to_thread(self.search_index.remove_video, video_id)
+
+        try:
+            await self._update_status(video_id, 'failed', 0, error=error)
+        except VideoDeleted:
+            # the cached record expired, still mark the catalog entry failed
+            await self.video_file_manager.update_status(video_id, 'failed')
+
+    def recover_interrupted_videos(self) -> None:
+        """Requeue videos whose processing was cut short by a restart
+        
+        Note:
+            Processing jobs live in the server process, so videos still
+            queued or processing in the catalog when it starts will never
+            finish on their own. This queues a job that resubmits each of
+            them, or marks it failed if its upload is gone or the queue is
+            full. Call it once when the server starts.
+        """
+        async def recover() -> ProcessingResult:
+            await self._recover_interrupted()
+            return {'success': True}
+
+        self.processing_queue.submit(recover)
+
+    async def _recover_interrupted(self) -> None:
+        requeued = failed = 0
+
+        for video in await self.video_file_manager.read_unfinished():
+            video_id = video['video_id']
+            video_dir = os.path.join(settings.MEDIA_ROOT, 'videos', video_id)
+            video_file = (
+                self.video_file_manager.find_video_file(video_dir) if os.path.isdir(video_dir) else None
             )
+
+            if video_file:
+                # the cached record may have expired, rebuild it from the catalog
+                video_info = await self.get_video_info(video_id) or video
+                await self.cache_service.set(f"video_{video_id}", {
+                    **video_info,
+                    'processing_status': 'queued',
+                    'processing_progress': 0
+                })
+                await self.video_file_manager.update_status(video_id, 'queued')
+
+                try:
+                    self._submit_processing(
+                        os.path.join(video_dir, video_file), video_id, video['original_filename']
+                    )
+                    requeued += 1
+                    continue
+                except ProcessingQueueFull:
+                    pass
+
+            await self._fail_processing(video_id, 'Processing was interrupted by a restart, upload the video again')
+            failed += 1
+
+        if requeued or failed:
+            print(f"Recovered interrupted videos: {requeued} requeued, {failed} marked failed")
+
+    async def _update_status(
+        self,
+        video_id: str,
+        status: str,
+        progress: int,
+        **fields: Any
+    ) -> None:
+        """Update processing status and progress on a video record
+        
+        Args:
+            video_id: ID of the video being processed
+            status: New processing status
+            progress: Processing progress percentage
+            **fields: Additional fields to store on the record
             
-            if limit and limit > 0:
-                sorted_videos = sorted_videos[:limit]
+        Raises:
+            VideoDeleted: If the video was deleted, nothing is recreated
+        """
+        video_info = await self.get_video_info(video_id)
+        if video_info is None:
+            raise VideoDeleted(video_id)
+        
+        video_info = {
+            **video_info,
+            'processing_status': status,
+            'processing_progress': progress,
+            **fields
+        }
+        
+        await self.cache_service.set(f"video_{video_id}", video_info)
+        await self._discard_if_deleted(
+            video_id, await self.video_file_manager.update_status(video_id, status)
+        )
 
-            return sorted_videos
+    async def _discard_if_deleted(self, video_id: str, exists: bool) -> None:
+        """Undo a write that raced with delete_video
         
-        except Exception as e:
-            print(f"Error getting all videos: {str(e)}")
-            return []
-    
+        Args:
+            video_id: ID of the video just written
+            exists: Whether its catalog entry was still there after the write
+            
+        Raises:
+            VideoDeleted: If it was not, after removing what was written
+            
+        Note:
+            delete_video removes the catalog entry before the cached data, so
+            a write checked after landing is either removed by the deletion
+            or sees the entry gone and is removed here.
+        """
+        if exists:
+            return
+        
+        await self.cache_service.delete_many([
+            f"video_{video_id}",
+            f"transcript_{video_id}",
+            f"embeddings_{video_id}"
+        ])
+        await asyncio.to_thread(self.search_index.remove_video, video_id)
+        raise VideoDeleted(video_id)
+
     async def process_video(
         self, 
         file_path: str, 
@@ -197,44 +435,79 @@ class VideoService:
             Dictionary containing processing results and metadata
         """
         try:
+            await self._update_status(video_id, 'processing', 5)
             file_size = os.path.getsize(file_path)
             
-            # get video duration and metadata
-            clip = VideoFileClip(file_path)
-            duration = clip.duration
-            width = clip.w
-            height = clip.h
-            clip.close()
-
-             # 3 minutes
-            if duration > 180: 
+            # container metadata only, over-length uploads stop here before any decoding
+            try:
+                media_info = await asyncio.to_thread(
+                    MediaProbe.probe, file_path, self.MAX_VIDEO_DURATION
+                )
+            except MediaTooLong:
                 return {
                     'success': False,
-                    'error': 'Video must be 3 minutes or shorter'
+                    'error': 'Video must be 3 minutes or shorter',
+                    'retryable': False
                 }
+            except MediaProbeError as e:
+                return {
+                    'success': False,
+                    'error': str(e),
+                    'retryable': False
+                }
+            
+            if not media_info['has_audio']:
+                return {
+                    'success': False,
+                    'error': 'Video has no audio track to transcribe',
+                    'retryable': False
+                }
+            
+            duration = media_info['duration']
+            width = media_info['width']
+            height = media_info['height']
 
-            # generate transcript
-            transcript = await self.transcript_service.generate_transcript(file_path)
+            # generate transcript from audio decoded once into the video's directory
+            await self._update_status(video_id, 'processing', 10, duration=duration, transcribed_seconds=0)
+            audio_path = await asyncio.to_thread(AudioExtractor.extract, file_path)
+            
+            on_partial = None
+            if settings.TRANSCRIPT_PARTIAL_UPDATES:
+                audio_duration = AudioExtractor.duration(audio_path)
+                
+                async def on_partial(
+                    partial: TranscriptResult,
+                    new_segments: List[TranscriptSegment],
+                    transcribed_seconds: float
+                ) -> None:
+                    await self._store_partial_transcript(
+                        video_id, partial, new_segments, transcribed_seconds, audio_duration
+                    )
+            
+            transcript = await self.transcript_service.generate_transcript(audio_path, on_partial)
             if not transcript['success']:
+                # deleting the video mid-way aborts transcription through on_partial
+                await self._discard_if_deleted(video_id, await self.video_file_manager.exists(video_id))
                 return transcript
 
+            await self._update_status(video_id, 'processing', 80, transcribed_seconds=duration)
+            await self._store_transcript(video_id, transcript)
+
             # generate thumbnail
+            await self._update_status(video_id, 'processing', 90)
             thumbnail_path = os.path.join(settings.MEDIA_ROOT, 'videos', video_id, 'thumbnail.jpg')
-            cap = cv2.VideoCapture(file_path)
-            
-            # get total frames and set it to middle
-            total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            middle_frame = total_frames // 2
-            cap.set(cv2.CAP_PROP_POS_FRAMES, middle_frame)
-        
-            ret, frame = cap.read()
-            if ret:
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                cv2.imwrite(thumbnail_path, frame)
+            await asyncio.to_thread(
+                self._generate_thumbnail,
+                file_path,
+                thumbnail_path,
+                MediaProbe.thumbnail_time(media_info)
+            )
             
-            cap.release()
+            # metadata, keeping the upload time the catalog and key index are sorted by
+            video_info = await self.get_video_info(video_id)
+            if video_info is None:
+                raise VideoDeleted(video_id)
             
-            # metadata
             metadata = {
                 'video_id': video_id,
                 'original_filename': original_filename,
@@ -242,19 +515,38 @@ class VideoService:
                 'duration': duration,
                 'width': width,
                 'height': height,
-                'created_at': datetime.utcnow().isoformat(),
-                'transcript': transcript,
+                'codec': media_info['codec'],
+                'frame_count': media_info['frame_count'],
+                'fps': media_info['fps'],
+                'created_at': video_info.get('created_at') or datetime.now(timezone.utc).isoformat(),
+                'sha256': video_info.get('sha256'),
                 'processing_status': 'completed',
-                'thumbnail': thumbnail_path
+                'processing_progress': 100,
+                'thumbnail': thumbnail_path,
+                'transcript_version': video_info.get('transcript_version')
             }
 
             await self.cache_service.set(f"video_{video_id}", metadata)
+            await self._discard_if_deleted(video_id, await self.video_file_manager.update_video(
+                video_id,
+                file_size=file_size,
+                duration=duration,
+                width=width,
+                height=height,
+                processing_status='completed'
+            ))
 
             return {
                 'success': True,
                 **metadata
             }
 
+        except VideoDeleted:
+            return {
+                'success': False,
+                'error': 'Video was deleted during processing',
+                'retryable': False
+            }
         except Exception as e:
             print(f"Video processing error: {e}")
             return {
@@ -262,14 +554,298 @@ class VideoService:
                 'error': str(e)
             }
 
+    async def _store_transcript(self, video_id: str, transcript: Dict[str, Any]) -> None:
+        """Store a generated transcript and add it to the library search index
+        
+        Args:
+            video_id: ID of the video
+            transcript: Successful result of generate_transcript, its
+                embeddings are moved to their own key
+            
+        Note:
+            Processing jobs check for a deletion right after this with their
+            next status update, see _discard_if_deleted.
+        """
+        # transcript and embeddings are stored apart from the small metadata record
+        embeddings = transcript.pop('embeddings')
+        await self._save_embeddings(video_id, embeddings)
+        await self.cache_service.set(f"transcript_{video_id}", transcript)
+        await asyncio.to_thread(self.search_index.add_video, video_id, embeddings, transcript['segments'])
+        await self._set_transcript_version(video_id, transcript['version'])
+
+    async def _set_transcript_version(self, video_id: str, version: str) -> None:
+        """Record the current transcript version on the small video record
+        
+        Args:
+            video_id: ID of the video
+            version: Version of the transcript just stored
+            
+        Note:
+            Lets cached search results be found without loading the
+            transcript, see get_cached_search.
+        """
+        video_info = await self.get_video_info(video_id)
+        if video_info is not None:
+            await self.cache_service.set(f"video_{video_id}", {**video_info, 'transcript_version': version})
+
+    async def _store_partial_transcript(
+        self,
+        video_id: str,
+        partial: TranscriptResult,
+        new_segments: List[TranscriptSegment],
+        transcribed_seconds: float,
+        audio_duration: float
+    ) -> None:
+        """Make a transcript searchable while the rest of the video is transcribed
+        
+        Args:
+            video_id: ID of the video being processed
+            partial: Transcript so far, its embeddings are moved to their own key
+            new_segments: Segments added since the previous partial transcript
+            transcribed_seconds: Seconds of audio transcribed so far
+            audio_duration: Length of the video's audio in seconds
+            
+        Note:
+            Progress moves from 10 to 80 in proportion to the audio
+            transcribed. The new segments are sent to the video's chat group
+            as a 'transcript.segments' event.
+        """
+        progress = 10 + int(70 * min(transcribed_seconds / audio_duration, 1)) if audio_duration else 10
+        
+        await self._store_transcript(video_id, partial)
+        await self._update_status(
+            video_id,
+            'processing',
+            progress,
+            transcribed_seconds=round(transcribed_seconds, 2)
+        )
+        
+        try:
+            await get_channel_layer().group_send(f"chat_{video_id}", {
+                'type': 'transcript.segments',
+                'segments': [{
+                    'start': segment['start'],
+                    'end': segment.get('end'),
+                    'text': segment['text']
+                } for segment in new_segments],
+                'transcribed_seconds': round(transcribed_seconds, 2),
+                'progress': progress
+            })
+        except Exception as e:
+            print(f"Transcript broadcast error: {e}")
+
+    async def retranscribe_video(self, video_id: str, reextract_audio: bool = False) -> bool:
+        """Regenerate a video's transcript with the current models
+        
+        Args:
+            video_id: ID of the video to re-transcribe
+            reextract_audio: Decode the audio from the video again instead
+                of using the cached copy
+            
+        Returns:
+            True if the video was re-transcribed, False if it does not exist
+            
+        Raises:
+            RuntimeError: If transcription fails
+        """
+        file_info = await self.get_video_file_info(video_id)
+        if not file_info:
+            return False
+        
+        audio_path = await asyncio.to_thread(
+            AudioExtractor.extract, file_info['file_path'], reextract_audio
+        )
+        transcript = await self.transcript_service.generate_transcript(audio_path)
+        if not transcript['success']:
+            raise RuntimeError(transcript['error'])
+        
+        await self._store_transcript(video_id, transcript)
+        return True
+
+    @staticmethod
+    def _generate_thumbnail(file_path: str, thumbnail_path: str, seconds: float) -> bool:
+        """Save the frame at a timestamp as a JPEG thumbnail
+        
+        Args:
+            file_path: Path to video file
+            thumbnail_path: Where to write the thumbnail
+            seconds: Timestamp of the frame, ideally a keyframe
+            
+        Returns:
+            True if a frame was read and written
+        """
+        cap = cv2.VideoCapture(file_path)
+        try:
+            cap.set(cv2.CAP_PROP_POS_MSEC, seconds * 1000)
+            
+            ret, frame = cap.read()
+            if ret:
+                cv2.imwrite(thumbnail_path, frame)
+            
+            return ret
+        finally:
+            cap.release()
+
+    async def search_video(
+        self,
+        video_id: str,
+        query: str,
+        transcript: Dict[str, Any]
+    ) -> List[SearchMatch]:
+        """Search one video's transcript, reusing cached results
+        
+        Args:
+            video_id: ID of the video to search
+            query: User's search query
+            transcript: The video's transcript data
+            
+        Returns:
+            List of matching segments with timestamps and confidence scores
+            
+        Note:
+            Results are keyed on the transcript version, which process_video
+            and reembed_video replace and delete_video removes, so stale
+            entries are never read again and simply expire.
+        """
+        cache_key = self._search_cache_key(video_id, transcript.get('version', 'legacy'), query)
+        
+        cached = await self.cache_service.get(cache_key)
+        if isinstance(cached, list):
+            return cached
+        
+        results = await self.transcript_service.search_transcript(query, transcript)
+        
+        # empty results may come from a transient error, only cache matches
+        if results:
+            await self.cache_service.set(cache_key, results, settings.SEARCH_RESULT_CACHE_TIMEOUT)
+        
+        return results
+
+    async def get_cached_search(
+        self,
+        video_id: str,
+        version: str,
+        query: str
+    ) -> Optional[List[SearchMatch]]:
+        """Get cached search results without loading the transcript
+        
+        Args:
+            video_id: ID of the video
+            version: Transcript version, as stored on the video record
+            query: User's search query
+            
+        Returns:
+            The cached matches, or None if this query was not cached
+        """
+        cached = await self.cache_service.get(self._search_cache_key(video_id, version, query))
+        return cached if isinstance(cached, list) else None
+
+    @staticmethod
+    def _search_cache_key(video_id: str, version: str, query: str) -> str:
+        normalized_query = ' '.join(query.lower().split())
+        digest = hashlib.sha256(normalized_query.encode()).hexdigest()
+        return f"search_{video_id}_{version}_{digest}"
+
+    async def search_library(self, query: str, limit: int = 10) -> List[SegmentHit]:
+        """Search transcript segments across every video
+        
+        Args:
+            query: User's search query
+            limit: Maximum number of hits to return
+            
+        Returns:
+            List of hits with video_id, timestamp, text and confidence
+        """
+        _, query_embedding = await self.transcript_service.encode_query(query)
+        # the first search in a process loads every shard from disk
+        return await asyncio.to_thread(self.search_index.search, query_embedding, limit)
+
+    async def reembed_video(self, video_id: str) -> bool:
+        """Recompute a processed video's segment embeddings
+        
+        Args:
+            video_id: ID of the video to re-embed
+            
+        Returns:
+            True if the video was re-embedded, False if it has no transcript
+        """
+        transcript = await self.get_transcript(video_id, with_embeddings=False)
+        if not transcript:
+            return False
+        
+        transcript = await self.transcript_service.reembed_transcript(transcript)
+        embeddings = transcript.pop('embeddings')
+        
+        await self._save_embeddings(video_id, embeddings)
+        await self.cache_service.set(f"transcript_{video_id}", transcript)
+        await asyncio.to_thread(self.search_index.add_video, video_id, embeddings, transcript['segments'])
+        
+        # move transcripts cached inline on the metadata record to their own key
+        video_info = await self.get_video_info(video_id)
+        if video_info:
+            video_info = {key: value for key, value in video_info.items() if key != 'transcript'}
+            video_info['transcript_version'] = transcript['version']
+            await self.cache_service.set(f"video_{video_id}", video_info)
+        
+        return True
+
+    async def _save_embeddings(self, video_id: str, embeddings: np.ndarray) -> None:
+        """Store a video's segment embedding matrix in compact binary form
+        
+        Args:
+            video_id: ID of the video
+            embeddings: Normalized segment embedding matrix
+        """
+        await self.cache_service.set_array(
+            f"embeddings_{video_id}",
+            embeddings.astype(settings.TRANSCRIPT_EMBEDDING_DTYPE)
+        )
+
+    async def get_transcript(
+        self,
+        video_id: str,
+        with_embeddings: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Get a video's transcript, loaded separately from its metadata
+        
+        Args:
+            video_id: ID of the video
+            with_embeddings: Whether to attach the segment embedding matrix
+            
+        Returns:
+            Transcript dictionary or None if the video has no transcript yet
+        """
+        transcript = await self.cache_service.get(f"transcript_{video_id}")
+        
+        if transcript is None:
+            # records cached before the split carry the transcript inline
+            video_info = await self.get_video_info(video_id)
+            transcript = video_info.get('transcript') if video_info else None
+        
+        if not isinstance(transcript, dict):
+            return None
+        
+        if with_embeddings:
+            # transcripts cached before binary storage still carry their embeddings inline
+            embeddings = await self.cache_service.get_array(f"embeddings_{video_id}")
+            if embeddings is not None:
+                transcript = {**transcript, 'embeddings': embeddings}
+        
+        return transcript
+
     async def get_video_info(self, video_id: str) -> Optional[Dict[str, Any]]:
-        """Get video information from cache
+        """Get video metadata from cache
         
         Args:
             video_id: ID of the video to retrieve
             
         Returns:
-            Video information dictionary or None if not found
+            Video metadata dictionary or None if not found
+            
+        Note:
+            The transcript is stored separately, load it with get_transcript.
+            The record may be shared through the in-process cache, copy it
+            before making changes.
         """
         return await self.cache_service.get(f"video_{video_id}")
     
@@ -292,11 +868,19 @@ class VideoService:
                 'error': 'Video not found'
             }
         
+        status = video_info.get('processing_status', 'unknown')
+        duration = video_info.get('duration')
+        
         return {
             'success': True,
             'video_id': video_id,
-            'status': video_info.get('processing_status', 'unknown'),
-            'progress': video_info.get('processing_progress', 0)
+            'status': status,
+            'progress': video_info.get('processing_progress', 0),
+            'duration': duration,
+            'transcribed_seconds': (
+                duration if status == 'completed' and duration is not None else
+                video_info.get('transcribed_seconds', 0)
+            )
         }
     
     async def delete_video(self, video_id: str) -> DeleteResult:
@@ -316,6 +900,10 @@ class VideoService:
                     'error': 'Video not found'
                 }
 
+            # remove the catalog entry first, a running processing job checks it
+            # after each write and stops, see _discard_if_deleted
+            await self.video_file_manager.remove_video(video_id)
+
             # delete the physical file
             temp_dir = os.path.join(settings.MEDIA_ROOT, 'videos', video_id)
             
@@ -328,8 +916,13 @@ class VideoService:
                 # remove the directory itself
                 os.rmdir(temp_dir)
 
-            # delete from cache
-            await self.cache_service.delete(f"video_{video_id}")
+            # delete from cache and library search index
+            await self.cache_service.delete_many([
+                f"video_{video_id}",
+                f"transcript_{video_id}",
+                f"embeddings_{video_id}"
+            ])
+            await asyncio.to_thread(self.search_index.remove_video, video_id)
 
             return {
                 'success': True,
@@ -341,4 +934,19 @@ class VideoService:
             return {
                 'success': False,
                 'error': str(e)
-            }
\ No newline at end of file
+            }
+
+
+_video_service: Optional[VideoService] = None
+_video_service_lock = threading.Lock()
+
+
+def get_video_service() -> VideoService:
+    """Get the process-wide video service, creating it on first use"""
+    global _video_service
+
+    with _video_service_lock:
+        if _video_service is None:
+            _video_service = VideoService()
+
+        return _video_service
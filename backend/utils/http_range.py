@@ -0,0 +1,236 @@
+# utils/http_range.py
+from typing import AsyncIterator, Final, List, Optional, Tuple
+import os
+import uuid
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
+from django.http.request import HttpRequest
+from django.http.response import HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+from utils.streaming import iter_file_range
+
+
+# type aliases
+# inclusive (first_byte, last_byte) pair
+ByteRange = Tuple[int, int]
+
+
+# more ranges than this in one request are ignored and the whole file is sent
+MAX_RANGES: Final[int] = 16
+
+def parse_range_header(range_header: str, file_size: int) -> Optional[List[ByteRange]]:
+    """Parse a Range header into satisfiable byte ranges
+
+    Args:
+        range_header: Value of the Range header
+        file_size: Size of the file being served
+
+    Returns:
+        - None if the header is missing, malformed or asks for too many
+          ranges, in which case it must be ignored and the whole file sent
+        - An empty list if no range is satisfiable (416)
+        - Otherwise the ranges clamped to the file, sorted and merged
+
+    Note:
+        Supports bytes=a-b, open ended bytes=a- and suffix bytes=-n specs,
+        several of them separated by commas.
+    """
+    units, _, range_set = range_header.partition('=')
+    if units.strip().lower() != 'bytes' or not range_set.strip():
+        return None
+
+    specs = [spec.strip() for spec in range_set.split(',') if spec.strip()]
+    if not specs or len(specs) > MAX_RANGES:
+        return None
+
+    ranges: List[ByteRange] = []
+    for spec in specs:
+        first, dash, last = spec.partition('-')
+        if not dash:
+            return None
+
+        try:
+            if not first:
+                # suffix range: the final n bytes
+                suffix_length = int(last)
+                if suffix_length <= 0 or file_size == 0:
+                    continue
+                ranges.append((max(file_size - suffix_length, 0), file_size - 1))
+                continue
+
+            first_byte = int(first)
+            last_byte = int(last) if last else None
+        except ValueError:
+            return None
+
+        if first_byte < 0 or (last_byte is not None and last_byte < first_byte):
+            return None
+        if first_byte >= file_size:
+            continue
+
+        ranges.append((first_byte, file_size - 1 if last_byte is None else min(last_byte, file_size - 1)))
+
+    # merge overlapping and adjacent ranges so no byte is sent twice
+    merged: List[ByteRange] = []
+    for first_byte, last_byte in sorted(ranges):
+        if merged and first_byte <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], last_byte))
+        else:
+            merged.append((first_byte, last_byte))
+
+    return merged
+
+def file_etag(stat: os.stat_result) -> str:
+    """Build a strong ETag from a file's size and modification time
+
+    Args:
+        stat: Result of os.stat on the file
+
+    Returns:
+        Quoted ETag string
+    """
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
+
+def if_range_matches(request: HttpRequest, etag: str, last_modified: int) -> bool:
+    """Check whether a Range header may be honoured under If-Range
+
+    Args:
+        request: HTTP request object
+        etag: Current ETag of the file
+        last_modified: Current modification time as a Unix timestamp
+
+    Returns:
+        True if there is no If-Range header or it still matches the file
+    """
+    if_range = request.META.get('HTTP_IF_RANGE', '').strip()
+    if not if_range:
+        return True
+
+    # entity tags must match strongly, weak ones never do
+    if if_range.startswith('"'):
+        return if_range == etag
+
+    if_range_date = parse_http_date_safe(if_range)
+    return if_range_date is not None and if_range_date == last_modified
+
+async def _iter_multipart(
+    file_path: str,
+    ranges: List[ByteRange],
+    parts: List[bytes],
+    closing: bytes
+) -> AsyncIterator[bytes]:
+    for (first_byte, last_byte), part_header in zip(ranges, parts):
+        yield part_header
+        async for chunk in iter_file_range(file_path, first_byte, last_byte - first_byte + 1):
+            yield chunk
+    yield closing
+
+def ranged_file_response(
+    request: HttpRequest,
+    file_path: str,
+    content_type: str
+) -> HttpResponseBase:
+    """Serve a file with range and conditional request support
+
+    Args:
+        request: GET or HEAD request for the file
+        file_path: Path of the file to serve
+        content_type: MIME type of the file
+
+    Returns:
+        - 304 or 412 when the request's preconditions say so
+        - 206 with one range, or multipart/byteranges for several
+        - 416 when no requested range is satisfiable
+        - 200 with the whole file otherwise
+
+    Note:
+        Responses carry ETag and Last-Modified validators and are marked
+        cacheable for VIDEO_CACHE_MAX_AGE since uploads never change.
+    """
+    stat = os.stat(file_path)
+    file_size = stat.st_size
+    etag = file_etag(stat)
+    last_modified = int(stat.st_mtime)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        range_header = request.META.get('HTTP_RANGE', '')
+        ranges = None
+        if range_header and if_range_matches(request, etag, last_modified):
+            ranges = parse_range_header(range_header, file_size)
+
+        response = _build_response(request, file_path, content_type, file_size, ranges)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    response['Cache-Control'] = f'public, max-age={settings.VIDEO_CACHE_MAX_AGE}, immutable'
+    return response
+
+def _build_response(
+    request: HttpRequest,
+    file_path: str,
+    content_type: str,
+    file_size: int,
+    ranges: Optional[List[ByteRange]]
+) -> HttpResponseBase:
+    head = request.method == 'HEAD'
+
+    if ranges is not None and not ranges:
+        return HttpResponse(
+            'Requested range not satisfiable',
+            status=416,
+            headers={'Content-Range': f'bytes */{file_size}'}
+        )
+
+    if ranges is None:
+        response = (
+            HttpResponse(content_type=content_type) if head else
+            StreamingHttpResponse(iter_file_range(file_path, 0, file_size), content_type=content_type)
+        )
+        response['Content-Length'] = str(file_size)
+        return response
+
+    if len(ranges) == 1:
+        first_byte, last_byte = ranges[0]
+        length = last_byte - first_byte + 1
+
+        response = (
+            HttpResponse(status=206, content_type=content_type) if head else
+            StreamingHttpResponse(
+                iter_file_range(file_path, first_byte, length),
+                status=206,
+                content_type=content_type
+            )
+        )
+        response['Content-Length'] = str(length)
+        response['Content-Range'] = f'bytes {first_byte}-{last_byte}/{file_size}'
+        return response
+
+    boundary = uuid.uuid4().hex
+    parts = [
+        (
+            f'\r\n--{boundary}\r\n'
+            f'Content-Type: {content_type}\r\n'
+            f'Content-Range: bytes {first_byte}-{last_byte}/{file_size}\r\n\r\n'
+        ).encode()
+        for first_byte, last_byte in ranges
+    ]
+    closing = f'\r\n--{boundary}--\r\n'.encode()
+    length = (
+        sum(len(part) for part in parts) + len(closing) +
+        sum(last_byte - first_byte + 1 for first_byte, last_byte in ranges)
+    )
+
+    multipart_type = f'multipart/byteranges; boundary={boundary}'
+    response = (
+        HttpResponse(status=206, content_type=multipart_type) if head else
+        StreamingHttpResponse(
+            _iter_multipart(file_path, ranges, parts, closing),
+            status=206,
+            content_type=multipart_type
+        )
+    )
+    response['Content-Length'] = str(length)
+    return response
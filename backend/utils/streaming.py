@@ -0,0 +1,85 @@
+# utils/streaming.py
+from typing import AsyncIterator, BinaryIO, Final, Optional
+import asyncio
+import os
+from urllib.parse import quote
+from django.conf import settings
+from django.http import HttpResponse
+
+
+# headers understood by the supported front proxies
+SENDFILE_HEADERS: Final[tuple[str, ...]] = ('X-Accel-Redirect', 'X-Sendfile')
+
+
+async def iter_file_range(
+    file_path: str,
+    start: int,
+    length: int,
+    chunk_size: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Stream a byte range of a file in bounded chunks
+
+    Args:
+        file_path: Path of the file to read
+        start: Offset of the first byte
+        length: Number of bytes to send
+        chunk_size: Bytes read per chunk (default VIDEO_STREAM_CHUNK_SIZE)
+
+    Yields:
+        Consecutive chunks of at most chunk_size bytes
+
+    Note:
+        Reads run on a worker thread so a slow disk never blocks the event
+        loop, and at most one chunk per response is held in memory.
+    """
+    chunk_size = chunk_size or settings.VIDEO_STREAM_CHUNK_SIZE
+
+    file_obj: BinaryIO = await asyncio.to_thread(open, file_path, 'rb')
+    try:
+        await asyncio.to_thread(file_obj.seek, start)
+
+        remaining = length
+        while remaining > 0:
+            chunk = await asyncio.to_thread(file_obj.read, min(chunk_size, remaining))
+            if not chunk:
+                break
+
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        await asyncio.to_thread(file_obj.close)
+
+
+def sendfile_response(file_path: str, content_type: str) -> Optional[HttpResponse]:
+    """Hand a file to the front proxy instead of streaming it through Python
+
+    Args:
+        file_path: Path of the file to serve
+        content_type: MIME type of the file
+
+    Returns:
+        Empty response carrying the configured sendfile header, or None if
+        VIDEO_SENDFILE_HEADER is not set
+
+    Note:
+        - X-Accel-Redirect (nginx) gets VIDEO_SENDFILE_PREFIX joined with the
+          path relative to MEDIA_ROOT, which must map to an internal location
+        - X-Sendfile (Apache, lighttpd) gets the absolute file path
+        - The proxy serves ranges and conditional requests itself
+    """
+    header = settings.VIDEO_SENDFILE_HEADER
+    if not header:
+        return None
+
+    if header not in SENDFILE_HEADERS:
+        raise ValueError(f"VIDEO_SENDFILE_HEADER must be one of {', '.join(SENDFILE_HEADERS)}")
+
+    if header == 'X-Accel-Redirect':
+        relative_path = os.path.relpath(file_path, settings.MEDIA_ROOT).replace(os.sep, '/')
+        location = quote(settings.VIDEO_SENDFILE_PREFIX.rstrip('/') + '/' + relative_path)
+    else:
+        location = os.path.abspath(file_path)
+
+    response = HttpResponse(content_type=content_type)
+    response[header] = location
+    return response
@@ -0,0 +1,163 @@
+# utils/upload_handlers.py
+from typing import Any, Dict, Optional
+import hashlib
+import os
+import uuid
+from django.conf import settings
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile, StopFutureHandlers
+from django.http.request import HttpRequest
+from utils.validators import MAX_FILE_SIZE, MIME_SNIFF_SIZE, validate_video_header
+
+
+class StagedVideoFile(UploadedFile):
+    """Video upload already written to the staging directory
+
+    Exposes ``temporary_file_path`` so storage backends move the file into
+    place instead of copying it, and carries the SHA-256 of its content.
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        name: str,
+        content_type: str,
+        size: int,
+        charset: Optional[str],
+        sha256: str,
+        content_type_extra: Optional[Dict[str, str]] = None
+    ):
+        super().__init__(file, name, content_type, size, charset, content_type_extra)
+        self.sha256: str = sha256
+
+    def temporary_file_path(self) -> str:
+        """Return the full path of the staged file"""
+        return self.file.name
+
+    def close(self) -> None:
+        """Close the file, deleting it unless it was moved into place"""
+        self.file.close()
+        try:
+            os.remove(self.file.name)
+        except FileNotFoundError:
+            pass
+
+
+class VideoUploadHandler(FileUploadHandler):
+    """Stream the ``video`` form field straight to disk
+
+    Chunks are written to VIDEO_UPLOAD_STAGING_DIR as they arrive and fed to
+    an incremental SHA-256, so the upload is never held in memory. The
+    leading bytes are checked with python-magic before anything else is
+    written past them, and the file is dropped as soon as it grows beyond
+    MAX_FILE_SIZE. Other file fields are left to the next handler.
+
+    A rejected upload leaves no ``video`` entry in ``request.FILES``, the
+    reason is available from get_upload_error.
+    """
+
+    FIELD_NAME: str = 'video'
+
+    def __init__(self, request: Optional[HttpRequest] = None):
+        super().__init__(request)
+        self.chunk_size = settings.VIDEO_UPLOAD_CHUNK_SIZE
+        self.active: bool = False
+        self.error: Optional[str] = None
+
+    def new_file(self, field_name: str, *args: Any, **kwargs: Any) -> None:
+        super().new_file(field_name, *args, **kwargs)
+
+        self.active = field_name == self.FIELD_NAME
+        if not self.active:
+            return
+
+        os.makedirs(settings.VIDEO_UPLOAD_STAGING_DIR, exist_ok=True)
+        path = os.path.join(settings.VIDEO_UPLOAD_STAGING_DIR, f'{uuid.uuid4().hex}.part')
+
+        self.file = open(path, 'wb+')
+        self.sha256 = hashlib.sha256()
+        self.header = b''
+        self.validated = False
+
+        # this handler owns the file, the default handlers never see it
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> Optional[bytes]:
+        if not self.active:
+            return raw_data
+
+        if start + len(raw_data) > MAX_FILE_SIZE:
+            self._reject("File size must be less than 100MB")
+
+        if not self.validated:
+            self.header += raw_data[:MIME_SNIFF_SIZE - len(self.header)]
+            if len(self.header) >= MIME_SNIFF_SIZE:
+                self._validate_header()
+
+        self.file.write(raw_data)
+        self.sha256.update(raw_data)
+        return None
+
+    def file_complete(self, file_size: int) -> Optional[StagedVideoFile]:
+        if not self.active:
+            return None
+
+        # files shorter than the sniff size are only checked once complete,
+        # too late to skip them, so the file is returned and removed on close
+        if not self.validated:
+            is_valid, error_message = validate_video_header(self.header)
+            if not is_valid:
+                self.error = error_message
+
+        self.active = False
+        self.file.flush()
+        self.file.seek(0)
+
+        return StagedVideoFile(
+            self.file,
+            self.file_name,
+            self.content_type,
+            file_size,
+            self.charset,
+            self.sha256.hexdigest(),
+            self.content_type_extra
+        )
+
+    def upload_interrupted(self) -> None:
+        if self.active:
+            self._discard()
+
+    def _validate_header(self) -> None:
+        is_valid, error_message = validate_video_header(self.header)
+        if not is_valid:
+            self._reject(error_message)
+        self.validated = True
+
+    def _reject(self, error_message: str) -> None:
+        self.error = error_message
+        self._discard()
+        raise SkipFile()
+
+    def _discard(self) -> None:
+        self.active = False
+        self.file.close()
+        try:
+            os.remove(self.file.name)
+        except FileNotFoundError:
+            pass
+
+
+def get_upload_error(request: HttpRequest) -> Optional[str]:
+    """Get the reason a video upload was rejected while streaming
+
+    Args:
+        request: HTTP request whose files have been parsed
+
+    Returns:
+        Error message or None if no upload was rejected
+    """
+    for handler in request.upload_handlers:
+        if isinstance(handler, VideoUploadHandler) and handler.error:
+            return handler.error
+
+    return None
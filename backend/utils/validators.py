@@ -20,6 +20,9 @@ ACCEPTED_TYPES: Final[List[MimeType]] = [
     'video/x-msvideo'
 ]
 
+# leading bytes python-magic needs to identify a file
+MIME_SNIFF_SIZE: Final[int] = 1024
+
 def validate_video_file(file: UploadedFile) -> ValidationResult:
     """Validate video file type and size
     
@@ -40,13 +43,31 @@ def validate_video_file(file: UploadedFile) -> ValidationResult:
     if file.size > MAX_FILE_SIZE:
         return False, "File size must be less than 100MB"
     
-    # Check MIME type using python-magic
-    mime_type = magic.from_buffer(file.read(1024), mime=True)
+    header = file.read(MIME_SNIFF_SIZE)
     
     # Reset file pointer to beginning
     file.seek(0)  
     
+    return validate_video_header(header)
+
+def validate_video_header(header: bytes) -> ValidationResult:
+    """Validate video file type from its leading bytes
+    
+    Args:
+        header: First MIME_SNIFF_SIZE bytes of the file (or all of it if shorter)
+        
+    Returns:
+        Tuple of (is_valid, error_message)
+        
+    Note:
+        Lets streaming upload handlers reject a file from its first chunk,
+        before the rest of it is received.
+    """
+    
+    # Check MIME type using python-magic
+    mime_type = magic.from_buffer(header, mime=True)
+    
     if mime_type not in ACCEPTED_TYPES:
         return False, "Invalid file type. Please upload MP4, MOV, or AVI"
         
-    return True, ""
\ No newline at end of file
+    return True, ""